@@ -7,7 +7,7 @@ from stats.postflop import PostflopStats, PostflopAnalyzer, calculate_postflop_s
 from stats.showdown import ShowdownStats, ShowdownAnalyzer, calculate_showdown_stats
 from stats.aggregate import (
     PlayerProfile, PlayStyle, ConditionalRule, Exploit,
-    ProfileAnalyzer, generate_profile
+    ProfileAnalyzer, generate_profile, generate_profiles
 )
 
 __all__ = [
@@ -33,4 +33,5 @@ __all__ = [
     'Exploit',
     'ProfileAnalyzer',
     'generate_profile',
+    'generate_profiles',
 ]
@@ -619,3 +619,32 @@ def generate_profile(
     """
     analyzer = ProfileAnalyzer()
     return analyzer.analyze(hands, player_id)
+
+
+def generate_profiles(
+    hands: list[ParsedHand],
+    player_ids: list[str]
+) -> dict[str, PlayerProfile]:
+    """
+    Generate profiles for several players from one pass over the hands.
+    
+    Every analyzer skips hands a player was not dealt into, so the hands are
+    bucketed per player first and each profile only walks its own bucket.
+    
+    Args:
+        hands: List of parsed hands
+        player_ids: Players to analyze
+        
+    Returns:
+        Dict mapping each player ID to its PlayerProfile, in input order
+    """
+    if len(player_ids) <= 1:
+        return {player_id: generate_profile(hands, player_id) for player_id in player_ids}
+    
+    buckets: dict[str, list[ParsedHand]] = {player_id: [] for player_id in player_ids}
+    for hand in hands:
+        for player_id in {player.player_id for player in hand.players}:
+            bucket = buckets.get(player_id)
+            if bucket is not None:
+                bucket.append(hand)
+    return {player_id: generate_profile(buckets[player_id], player_id) for player_id in player_ids}
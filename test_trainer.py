@@ -1,21 +1,91 @@
 #!/usr/bin/env python3
 """Smoke tests for trainer scenario generation and EV evaluation."""
 
+import http.client
 import json
+import random
+import threading
+import time
+from contextlib import contextmanager
+from itertools import combinations
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from types import SimpleNamespace
 from unittest.mock import patch
 
+from trainer.cards import best_hand_rank, best_hand_ranks, full_deck, hand_rank_5
+from trainer.live_play import LiveMatch
 from trainer.poker_theory import (
     break_even_bluff_fold_frequency,
     minimum_defense_frequency,
     polarized_bluff_share,
     required_equity_to_call,
 )
+from trainer.server import (
+    MAX_JSON_BODY,
+    MAX_UPLOAD_BODY,
+    PooledHTTPServer,
+    ResponseCache,
+    TrainerRequestHandler,
+    _gzip_acceptable,
+    make_handler_class,
+)
 from trainer.service import TrainerService
 
 
+@contextmanager
+def _trainer_service():
+    """A TrainerService on a throwaway db whose uploads land in a temp directory."""
+    with TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        service = TrainerService(db_path=root / "trainer.db")
+        uploaded_dir = root / "uploaded_hands"
+        uploaded_dir.mkdir(parents=True, exist_ok=True)
+        service._uploaded_hands_dir = lambda user_scope=None: uploaded_dir
+        yield service, uploaded_dir
+
+
+def _hand_file_bytes(player_id: str, name: str, hands: int = 1) -> bytes:
+    hand = {"players": [{"id": player_id, "name": name}, {"id": "hero", "name": "hero"}]}
+    return json.dumps({"hands": [hand] * hands}).encode("utf-8")
+
+
+def _reference_rank(cards):
+    return max(hand_rank_5(combo) for combo in combinations(cards, 5))
+
+
+def _multipart_body(boundary: str, filename: str, content: bytes) -> bytes:
+    head = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="files"; filename="{filename}"\r\n'
+        "Content-Type: application/json\r\n\r\n"
+    ).encode("utf-8")
+    return head + content + f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+
+@contextmanager
+def _running_server(service, response_cache=None, http_threads=2):
+    handler = make_handler_class(service, "trainer/web", response_cache=response_cache)
+    server = PooledHTTPServer(("127.0.0.1", 0), handler, http_threads=http_threads)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _request(port, method, path, body=b"", headers=None):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        conn.request(method, path, body=body, headers=headers or {})
+        response = conn.getresponse()
+        return response.status, json.loads(response.read() or b"null")
+    finally:
+        conn.close()
+
+
 def test_trainer_generate_and_evaluate():
     db_path = Path("trainer/data/test_trainer.db")
     if db_path.exists():
@@ -340,3 +410,215 @@ def test_analyzer_profile_cache_invalidates_when_hands_change():
             _third = service.analyzer_profile("friend_one")
             assert counters["load_hands"] == 3
             assert counters["generate_profile"] == 2
+
+
+def test_upload_hands_seeds_index_without_reparsing_stored_files():
+    with _trainer_service() as (service, _uploaded_dir):
+        summarize = TrainerService._summarize_hand_file
+        with patch.object(TrainerService, "_summarize_hand_file", side_effect=summarize) as summarized:
+            status = service.upload_hands([("h1.json", _hand_file_bytes("player_friend_one", "friend_one"))])
+            service.hands_players()
+
+        assert summarized.call_count == 1
+        assert status["total_hands"] == 1
+        assert {row["username"] for row in status["players"]} == {"friend_one", "hero"}
+
+
+def test_best_hand_rank_matches_five_card_evaluator():
+    rng = random.Random(2026)
+    deck = full_deck()
+    spades_and_hearts = [c for c in deck if c[1] in "sh"]
+    for trial in range(1500):
+        # Every third hand is drawn from two suits so flushes and straight flushes show up.
+        pool = spades_and_hearts if trial % 3 == 0 else deck
+        cards = rng.sample(pool, rng.choice((5, 6, 7)))
+        assert best_hand_rank(cards) == _reference_rank(cards), cards
+
+
+def test_targeted_hand_starts_with_symmetric_investment():
+    for seed in range(1, 41):
+        match = LiveMatch({"name": "villain"}, seed=seed, mode="targeted")
+        hand = match.current_hand
+        assert hand.hero_invested_bb == hand.villain_invested_bb
+        assert hand.hero_remaining_bb == hand.villain_remaining_bb
+        assert hand.hero_invested_dbb + hand.villain_invested_dbb == hand.pot_dbb
+        assert all(isinstance(v, int) for v in (hand.pot_dbb, hand.hero_remaining_dbb, hand.villain_remaining_dbb))
+
+
+def test_best_hand_ranks_match_per_holding_evaluation():
+    rng = random.Random(77)
+    deck = full_deck()
+    for trial in range(120):
+        pool = [c for c in deck if c[1] in "sd"] if trial % 2 else deck
+        board = rng.sample(pool, rng.choice((3, 4, 5)))
+        rest = [c for c in deck if c not in board]
+        holes = [tuple(rng.sample(rest, 2)) for _ in range(20)]
+        # Range rows may repeat a board card once later streets are dealt.
+        holes.append((board[0], rest[0]))
+        expected = [_reference_rank(list(hole) + board) for hole in holes]
+        assert best_hand_ranks(holes, board) == expected
+
+
+def test_server_config_tracks_uploads_and_deletes():
+    with _trainer_service() as (service, _uploaded_dir), _running_server(service) as port:
+        status, config = _request(port, "GET", "/api/config")
+        assert status == 200
+        assert config["live"]["analyzer_players"] == []
+
+        boundary = "trainerboundary"
+        status, uploaded = _request(
+            port,
+            "POST",
+            "/api/hands/upload",
+            body=_multipart_body(boundary, "h1.json", _hand_file_bytes("player_friend_one", "friend_one")),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+        assert status == 200
+        status, config = _request(port, "GET", "/api/config")
+        assert "id:player_friend_one" in config["live"]["analyzer_players"]
+
+        stored = uploaded["saved_files"][0]["stored_filename"]
+        status, _ = _request(port, "POST", "/api/hands/delete", body=json.dumps({"filename": stored}))
+        assert status == 200
+        status, config = _request(port, "GET", "/api/config")
+        assert config["live"]["analyzer_players"] == []
+
+
+def test_idle_keepalive_connections_release_pool_workers():
+    with TemporaryDirectory() as tmp:
+        service = TrainerService(db_path=Path(tmp) / "trainer.db")
+        with _running_server(service, http_threads=2) as port:
+            idle = []
+            try:
+                for _ in range(2):
+                    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                    conn.request("GET", "/api/health")
+                    conn.getresponse().read()
+                    idle.append(conn)
+                # Both workers now sit on an idle kept-alive socket; a new client
+                # only waits out the short keep-alive wait, not the read timeout.
+                started = time.monotonic()
+                assert _request(port, "GET", "/api/health") == (200, {"ok": True})
+                assert time.monotonic() - started < TrainerRequestHandler.timeout
+            finally:
+                for conn in idle:
+                    conn.close()
+
+
+def test_gzip_only_for_clients_that_accept_it():
+    for header in ("gzip", "deflate, gzip;q=0.5", "x-gzip", "br, *", "GZIP;Q=1"):
+        assert _gzip_acceptable(header), header
+    for header in ("", "identity", "deflate, br", "gzip;q=0", "gzip; q=0.000, *", "*;q=0"):
+        assert not _gzip_acceptable(header), header
+
+
+def test_cleared_scenarios_are_not_served_from_the_response_cache():
+    with TemporaryDirectory() as tmp:
+        service = TrainerService(db_path=Path(tmp) / "trainer.db")
+        cache = ResponseCache()
+        with _running_server(service, cache) as port:
+            scenario = service.generate({"num_players": 6, "street": "flop", "seed": 5})
+            path = f"/api/scenario?scenario_id={scenario['scenario_id']}"
+            assert _request(port, "GET", path)[0] == 200
+            assert _request(port, "POST", "/api/clear_saved_hands")[0] == 200
+            # The cached body is gone with the scenario, so a refetch hits the store and fails.
+            try:
+                cache.scenario(service, scenario["scenario_id"])
+            except ValueError:
+                pass
+            else:
+                raise AssertionError("cleared scenario was still served from the cache")
+
+
+def test_server_rejects_oversized_bodies_with_413():
+    with TemporaryDirectory() as tmp:
+        service = TrainerService(db_path=Path(tmp) / "trainer.db")
+        with _running_server(service) as port:
+            for path, limit, content_type in (
+                ("/api/generate", MAX_JSON_BODY, "application/json"),
+                ("/api/hands/upload", MAX_UPLOAD_BODY, "multipart/form-data; boundary=x"),
+            ):
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                try:
+                    # Only the headers are sent: the limit is enforced before the body is read.
+                    conn.putrequest("POST", path)
+                    conn.putheader("Content-Type", content_type)
+                    conn.putheader("Content-Length", str(limit + 1))
+                    conn.endheaders()
+                    response = conn.getresponse()
+                    assert response.status == 413
+                    assert response.getheader("Connection") == "close"
+                    assert str(limit) in json.loads(response.read())["error"]
+                finally:
+                    conn.close()
+
+            # A batch just under the service's own limit is read, not refused on size;
+            # it carries no "files" part, so the service answers with its usual 400.
+            boundary = "trainerboundary"
+            body = (
+                f"--{boundary}\r\n"
+                'Content-Disposition: form-data; name="padding"\r\n\r\n'
+            ).encode("utf-8")
+            closing = f"\r\n--{boundary}--\r\n".encode("utf-8")
+            body += b"x" * (TrainerService.MAX_UPLOAD_BATCH_BYTES - 1 - len(body) - len(closing)) + closing
+            status, payload = _request(
+                port,
+                "POST",
+                "/api/hands/upload",
+                body=body,
+                headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            )
+            assert status == 400
+            assert payload["error"] == "No files uploaded"
+
+
+def test_app_config_json_follows_uploads_and_deletes():
+    with _trainer_service() as (service, uploaded_dir):
+
+        def analyzer_players():
+            return json.loads(service.app_config_json())["live"]["analyzer_players"]
+
+        assert analyzer_players() == []
+        assert service.app_config_json() is service.app_config_json()
+
+        saved = service.upload_hands([("h1.json", _hand_file_bytes("player_friend_one", "friend_one"))])
+        assert "id:player_friend_one" in analyzer_players()
+
+        # Files changed behind the service's back are picked up too.
+        (uploaded_dir / "manual.json").write_bytes(_hand_file_bytes("player_friend_two", "friend_two"))
+        assert "id:player_friend_two" in analyzer_players()
+
+        service.delete_uploaded_hands_file(saved["saved_files"][0]["stored_filename"])
+        (uploaded_dir / "manual.json").unlink()
+        assert analyzer_players() == []
+
+
+def test_analyzer_profile_caches_follow_snapshot_and_resolved_ids():
+    with _trainer_service() as (service, _uploaded_dir):
+        hand_files = sorted(Path("hands").glob("*.json"))
+        assert hand_files
+        service.upload_hands([(hand_files[0].name, hand_files[0].read_bytes())])
+        row = service.hands_players()["players"][0]
+
+        import parser
+
+        calls = {"load_hands": 0}
+        real_load_hands = parser.load_hands
+
+        def counting_load_hands(path):
+            calls["load_hands"] += 1
+            return real_load_hands(path)
+
+        with patch("parser.load_hands", side_effect=counting_load_hands):
+            by_name = service.analyzer_profile(row["username"])
+            assert service.analyzer_profile(row["username"]) is by_name
+            assert calls["load_hands"] == 1
+
+            # Another spelling of the same bucket reuses the per-player profiles.
+            by_key = service.analyzer_profile(row["selection_key"])
+            assert calls["load_hands"] == 1
+            assert by_key["vpip"] == by_name["vpip"]
+
+            service.upload_hands([("extra.json", _hand_file_bytes("someone_else", "someone_else"))])
+            service.analyzer_profile(row["username"])
+            assert calls["load_hands"] == 3
@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from itertools import combinations
-from typing import Iterable, List, Sequence, Tuple
+from itertools import combinations, combinations_with_replacement
+from math import prod
+from typing import Callable, Iterable, List, Sequence, Tuple
 
 from trainer.constants import CARD_RANKS, CARD_SUITS
 
@@ -115,20 +116,138 @@ def hand_rank_5(cards: Sequence[str]) -> Tuple[int, Tuple[int, ...]]:
     return (0, tuple(sorted(ranks, reverse=True)))
 
 
+# Cactus-Kev style lookup: each rank gets a prime so a 5-card rank multiset has a
+# unique product, and flushes are keyed by their 5-bit rank mask instead.
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# card -> (rank prime, rank bit, suit bit)
+_CARD_CODES = {
+    f"{r}{s}": (_RANK_PRIMES[RANK_TO_VALUE[r] - 2], 1 << (RANK_TO_VALUE[r] - 2), 1 << i)
+    for r in CARD_RANKS
+    for i, s in enumerate(CARD_SUITS)
+}
+
+
+def _build_rank_tables() -> Tuple[dict, dict]:
+    """Evaluate every distinct 5-card rank pattern once with ``hand_rank_5``."""
+    flush_table: dict[int, Tuple[int, Tuple[int, ...]]] = {}
+    unsuited_table: dict[int, Tuple[int, Tuple[int, ...]]] = {}
+    for ranks in combinations_with_replacement(CARD_RANKS, 5):
+        if ranks[0] == ranks[4]:
+            continue  # five of a kind
+        product = 1
+        for r in ranks:
+            product *= _RANK_PRIMES[RANK_TO_VALUE[r] - 2]
+        # Cycling suits can only repeat a suit on cards 0 and 4, which never share a rank here.
+        unsuited_table[product] = hand_rank_5([r + CARD_SUITS[i % 4] for i, r in enumerate(ranks)])
+        if len(set(ranks)) == 5:
+            mask = 0
+            for r in ranks:
+                mask |= 1 << (RANK_TO_VALUE[r] - 2)
+            flush_table[mask] = hand_rank_5([r + CARD_SUITS[0] for r in ranks])
+    return flush_table, unsuited_table
+
+
+_FLUSH_RANKS, _UNSUITED_RANKS = _build_rank_tables()
+
+
+def _rank_5_codes(codes: Sequence[Tuple[int, int, int]]) -> Tuple[int, Tuple[int, ...]]:
+    (p1, b1, s1), (p2, b2, s2), (p3, b3, s3), (p4, b4, s4), (p5, b5, s5) = codes
+    if s1 & s2 & s3 & s4 & s5:
+        return _FLUSH_RANKS[b1 | b2 | b3 | b4 | b5]
+    return _UNSUITED_RANKS[p1 * p2 * p3 * p4 * p5]
+
+
 def best_hand_rank(cards: Sequence[str]) -> Tuple[int, Tuple[int, ...]]:
     """Rank best 5-card hand from 5-7 cards."""
     if len(cards) < 5 or len(cards) > 7:
         raise ValueError("best_hand_rank requires 5 to 7 cards")
-    if len(cards) == 5:
-        return hand_rank_5(cards)
+    if len(set(cards)) != len(cards):
+        # Duplicate cards fall outside the lookup tables; rank them the slow way.
+        return max(hand_rank_5(combo) for combo in combinations(cards, 5))
+    codes = [_CARD_CODES[c] for c in cards]
+    if len(codes) == 5:
+        return _rank_5_codes(codes)
+    suits = [c[1] for c in cards]
+    if max(map(suits.count, CARD_SUITS)) < 5:
+        # No subset can be a flush, so each 5-card rank is keyed by its prime product alone.
+        primes = [code[0] for code in codes]
+        return max(map(_UNSUITED_RANKS.__getitem__, map(prod, combinations(primes, 5))))
     best = (-1, tuple())
-    for combo in combinations(cards, 5):
-        rank = hand_rank_5(combo)
+    for combo in combinations(codes, 5):
+        rank = _rank_5_codes(combo)
         if rank > best:
             best = rank
     return best
 
 
+def board_ranker(board: Sequence[str]) -> Callable[[str, str], Tuple[int, Tuple[int, ...]]]:
+    """Return ``rank(c1, c2) == best_hand_rank([c1, c2] + board)`` for one 3-5 card board."""
+    board = list(board)
+    if len(board) < 3 or len(board) > 5:
+        raise ValueError("board_ranker requires a 3 to 5 card board")
+    board_set = set(board)
+    if len(board_set) != len(board):
+        return lambda c1, c2: best_hand_rank([c1, c2] + board)
+
+    # A 3-5 card board has at most one suit with 3+ cards, and only that suit can
+    # make a flush. Holdings that cannot reach five of it rank by prime product,
+    # sharing the board primes; everything else takes the full evaluator.
+    flush_suit = ""
+    flush_need = 3
+    for suit in CARD_SUITS:
+        count = sum(1 for c in board if c[1] == suit)
+        if count >= 3:
+            flush_suit = suit
+            flush_need = 5 - count
+    board_rank_counts = {}
+    for c in board:
+        board_rank_counts[c[0]] = board_rank_counts.get(c[0], 0) + 1
+    # Every 5-card subset is (both hole cards + 3 board), (one hole card + 4 board)
+    # or (5 board), so the board's partial prime products are shared by all holdings.
+    board_primes = [_CARD_CODES[c][0] for c in board]
+    board_3 = [prod(p) for p in combinations(board_primes, 3)]
+    board_4 = [prod(p) for p in combinations(board_primes, 4)]
+    board_best = _UNSUITED_RANKS[prod(board_primes)] if len(board) == 5 else None
+    lookup = _UNSUITED_RANKS.__getitem__
+
+    def rank(c1: str, c2: str) -> Tuple[int, Tuple[int, ...]]:
+        if (c1[1] == flush_suit) + (c2[1] == flush_suit) >= flush_need:
+            return best_hand_rank([c1, c2] + board)
+        if c1 == c2 or c1 in board_set or c2 in board_set:
+            # A holding that repeats a card (range rows can overlap later streets) still
+            # ranks by prime product unless a rank would appear more than four times.
+            same = c1[0] == c2[0]
+            if (
+                board_rank_counts.get(c1[0], 0) + 1 + same > 4
+                or board_rank_counts.get(c2[0], 0) + 1 + same > 4
+            ):
+                return best_hand_rank([c1, c2] + board)
+        p1 = _CARD_CODES[c1][0]
+        p2 = _CARD_CODES[c2][0]
+        pair = p1 * p2
+        keys = [pair * b for b in board_3]
+        keys += [p1 * b for b in board_4]
+        keys += [p2 * b for b in board_4]
+        best = max(map(lookup, keys))
+        if board_best is not None and board_best > best:
+            return board_best
+        return best
+
+    return rank
+
+
+def best_hand_ranks(
+    holes: Iterable[Sequence[str]],
+    board: Sequence[str],
+) -> List[Tuple[int, Tuple[int, ...]]]:
+    """``best_hand_rank(hole + board)`` for many two-card holdings on one 3-5 card board."""
+    if len(board) < 3 or len(board) > 5:
+        raise ValueError("best_hand_ranks requires a 3 to 5 card board")
+    rank = board_ranker(board)
+    return [rank(h[0], h[1]) for h in holes]
+
+
 def compare_hands(cards_a: Sequence[str], cards_b: Sequence[str]) -> int:
     """Compare two 5-7-card hands. 1 if A wins, -1 if B wins, 0 tie."""
     ra = best_hand_rank(cards_a)
@@ -180,6 +299,18 @@ def preflop_strength_score(card_a: str, card_b: str) -> float:
     return max(0.0, min(100.0, score))
 
 
+CARD_INDEX = {card: idx for idx, card in enumerate(full_deck())}
+
+# Flat 52x52 table of ``preflop_strength_score(a, b) / 100.0`` keyed by
+# ``CARD_INDEX[a] * 52 + CARD_INDEX[b]`` (filled symmetrically, diagonal unused).
+PREFLOP_STRENGTH_TABLE: List[float] = [0.0] * (52 * 52)
+for _a, _ia in CARD_INDEX.items():
+    for _b, _ib in CARD_INDEX.items():
+        if _ia != _ib:
+            PREFLOP_STRENGTH_TABLE[_ia * 52 + _ib] = preflop_strength_score(_a, _b) / 100.0
+del _a, _ia, _b, _ib
+
+
 def board_texture_score(board: Sequence[str]) -> float:
     """Rough texture score; higher means wetter board."""
     if len(board) < 3:
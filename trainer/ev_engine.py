@@ -264,7 +264,6 @@ class EvCalculator:
         for _ in range(n):
             deck = list(base_deck)
             villain_hands: List[Tuple[str, str]] = []
-            valid_sample = True
             for villain in villains:
                 archetype = archetype_by_key(villain["archetype_key"])
                 hand = sample_villain_hand(
@@ -276,16 +275,10 @@ class EvCalculator:
                     pressure=pressure,
                     rng=self.rng,
                 )
-                if hand[0] == hand[1]:
-                    valid_sample = False
-                    break
                 villain_hands.append(hand)
                 deck.remove(hand[0])
                 deck.remove(hand[1])
 
-            if not valid_sample:
-                continue
-
             runout = self.rng.sample(deck, board_missing) if board_missing > 0 else []
             final_board = self.board + runout
             hero_rank = best_hand_rank(self.hero_hand + final_board)
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import itertools
+import heapq
 import math
+import operator
 import random
 import uuid
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
 from trainer.cards import (
+    CARD_INDEX,
+    PREFLOP_STRENGTH_TABLE,
     best_hand_rank,
+    best_hand_ranks,
     board_texture_score,
     card_rank,
     card_suit,
@@ -19,9 +23,80 @@ from trainer.cards import (
     rank_category_name,
     remove_cards,
 )
-from trainer.constants import BET_SIZE_PCTS
+from trainer.constants import BET_SIZE_PCTS, CARD_SUITS, STREETS
 from trainer.scenario import generate_scenario
 
+# Bit encodings for _combo_draw_strength: one bit per rank (2..A -> bits 0..12)
+# and one 4-bit counter lane per suit, so all four suit counts share one int.
+_RANK_BIT = {c: 1 << (card_rank(c) - 2) for c in full_deck()}
+_SUIT_LANE = {c: 1 << (4 * CARD_SUITS.index(card_suit(c))) for c in full_deck()}
+_LANE_LOW_BITS = 0x1111
+
+
+def _longest_run(rank_mask: int) -> int:
+    run = 0
+    while rank_mask:
+        rank_mask &= rank_mask >> 1
+        run += 1
+    return run
+
+
+# Longest run of consecutive ranks for every 13-bit rank mask.
+_BEST_RUN = [_longest_run(m) for m in range(1 << 13)]
+
+# Streets as ints for hot-path dispatch and per-street coefficient tuples.
+_STREET_ID = {street: idx for idx, street in enumerate(STREETS)}
+_PREFLOP, _FLOP, _TURN, _RIVER = range(len(STREETS))
+
+# Parameterized action-history lines. Entries are stored as (key, *args) tuples and
+# only formatted when the hand is serialized; fixed lines are stored as plain str.
+_HISTORY_FORMATS = {
+    "hand_intro": "Hand {}: Hero ({}) vs {} ({}).",
+    "hero_posts_sb": "Hero posts SB {:.1f}bb.",
+    "hero_posts_bb": "Hero posts BB {:.1f}bb.",
+    "villain_posts_sb": "Villain posts SB {:.1f}bb.",
+    "villain_posts_bb": "Villain posts BB {:.1f}bb.",
+    "hero_calls": "Hero calls {:.1f}bb.",
+    "hero_bets": "Hero bets {:.1f}bb ({}).",
+    "hero_raises": "Hero raises {:.1f}bb ({}).",
+    "villain_raises_sb": "Villain raises {:.1f}bb from SB.",
+    "villain_limps": "Villain limps/calls {:.1f}bb.",
+    "villain_bets": "Villain bets {:.1f}bb.",
+    "villain_bets_after_check": "Villain bets {:.1f}bb after check.",
+    "villain_calls": "Villain calls {:.1f}bb.",
+    "targeted_loaded": "Targeted spot loaded vs {}.",
+    "street": "--- {} ---",
+    "showdown": "Showdown: {}. Hero delta {:.2f}bb.",
+    "hand_ends": "Hand ends: {}",
+}
+
+
+def _size_options_from_ascending(candidates: List[int], low: int, high: int) -> List[float]:
+    """First six distinct deci-bb candidates within [low, high], in bb.
+
+    ``candidates`` must already be non-decreasing, so duplicates are adjacent.
+    """
+    out: List[float] = []
+    last = -1
+    for v in candidates:
+        if v == last or v < low or v > high:
+            continue
+        last = v
+        out.append(v / 10.0)
+        if len(out) >= 6:
+            break
+    return out
+
+
+def _format_history_entry(entry: str | tuple) -> str:
+    if isinstance(entry, str):
+        return entry
+    return _HISTORY_FORMATS[entry[0]].format(*entry[1:])
+
+
+# Pot fractions offered as bet sizes, ascending (1.0 adds a pot-sized bet).
+_BET_OPTION_PCTS = tuple(sorted(set(BET_SIZE_PCTS) | {1.0}))
+
 
 def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
@@ -40,16 +115,21 @@ def _round1(value: float) -> float:
     return round(max(0.0, float(value)), 1)
 
 
+def _to_dbb(value: float) -> int:
+    """Chip amount in integer tenths of a big blind (the granularity of every live-play bet)."""
+    # Quantize via _round1 first: round(x * 10) would round exact .x5 ties to even.
+    return int(round(_round1(value) * 10))
+
+
 def _street_board_count(street: str) -> int:
     return {"preflop": 0, "flop": 3, "turn": 4, "river": 5}[street]
 
 
 def _next_street(street: str) -> Optional[str]:
-    order = ["preflop", "flop", "turn", "river"]
-    idx = order.index(street)
-    if idx + 1 >= len(order):
+    idx = _STREET_ID[street] + 1
+    if idx >= len(STREETS):
         return None
-    return order[idx + 1]
+    return STREETS[idx]
 
 
 def _sigmoid(x: float) -> float:
@@ -63,8 +143,7 @@ def _canonical_combo(cards: List[str] | tuple[str, str]) -> tuple[str, str]:
     return (b, a)
 
 
-def _combo_key(cards: List[str] | tuple[str, str]) -> str:
-    c1, c2 = cards[0], cards[1]
+def _build_combo_key(c1: str, c2: str) -> str:
     r1 = c1[0]
     r2 = c2[0]
     v1 = card_rank(c1)
@@ -78,15 +157,157 @@ def _combo_key(cards: List[str] | tuple[str, str]) -> str:
     return f"{r1}{r2}{'s' if suited else 'o'}"
 
 
-def _normalize_distribution(weights: Dict[str, float]) -> Dict[str, float]:
-    total = sum(max(0.0, v) for v in weights.values())
+# Every ordered pair of distinct cards -> its "AKs"-style key, so range seeding
+# does a dict hit per combo instead of four card_rank/card_suit calls.
+_COMBO_KEYS = {(a, b): _build_combo_key(a, b) for a in full_deck() for b in full_deck() if a != b}
+
+
+def _combo_key(cards: List[str] | tuple[str, str]) -> str:
+    c1, c2 = cards[0], cards[1]
+    try:
+        return _COMBO_KEYS[c1, c2]
+    except KeyError:
+        return _build_combo_key(c1, c2)
+
+
+def _normalize_distribution(weights: List[float]) -> List[float]:
+    """Normalize action weights that are positionally aligned with an ``actions`` list."""
+    # Only ever sees 2-5 actions, so a plain loop beats generator + comprehension passes.
+    clamped = []
+    total = 0.0
+    for v in weights:
+        v = v if v > 0.0 else 0.0
+        clamped.append(v)
+        total += v
     if total <= 0:
-        n = max(1, len(weights))
-        return {k: 1.0 / n for k in weights}
-    return {k: max(0.0, v) / total for k, v in weights.items()}
+        share = 1.0 / max(1, len(clamped))
+        return [share] * len(clamped)
+    return [v / total for v in clamped]
+
+
+def _top_distinct_keys(weights: List[float], keys: List[str], limit: int) -> List[str]:
+    """First ``limit`` distinct keys in descending-weight order (ties keep table order)."""
+    n = len(weights)
+    # A hand-class key covers at most 12 combos, so a bounded partial selection is
+    # almost always enough; widen it only when the top rows collapse into few keys.
+    k = min(n, limit * 4)
+    while True:
+        top_keys: List[str] = []
+        seen = set()
+        for idx in heapq.nlargest(k, range(n), key=weights.__getitem__):
+            key = keys[idx]
+            if key in seen:
+                continue
+            top_keys.append(key)
+            seen.add(key)
+            if len(top_keys) >= limit:
+                return top_keys
+        if k >= n:
+            return top_keys
+        k = min(n, k * 4)
+
+
+def _board_draw_context(board: List[str]) -> tuple[int, int, int, int, int]:
+    """Board-only inputs of the draw check, for a board of three or more cards.
+
+    Returns ``(n_board, board_suits, board_ranks, board_two_suited, board_high_bit)``.
+    """
+    board_suits = 0
+    board_ranks = 0
+    for c in board:
+        board_suits += _SUIT_LANE[c]
+        board_ranks |= _RANK_BIT[c]
+    # Lane >= 2 on the board alone.
+    board_two_suited = ((board_suits >> 1) | (board_suits >> 2)) & _LANE_LOW_BITS
+    board_high_bit = 1 << (board_ranks.bit_length() - 1)
+    return len(board), board_suits, board_ranks, board_two_suited, board_high_bit
+
+
+def _draw_strength_on(draw_ctx: tuple[int, int, int, int, int], c1: str, c2: str) -> float:
+    """Draw strength of hole cards ``c1``/``c2`` against a ``_board_draw_context``."""
+    n_board, board_suits, board_ranks, board_two_suited, board_high_bit = draw_ctx
+    flush_draw = 0.0
+    straight_draw = 0.0
+    if n_board < 5:
+        # Lane >= 4 across hole+board cards, on a suit the board already shows twice.
+        suits = board_suits + _SUIT_LANE[c1] + _SUIT_LANE[c2]
+        if (suits >> 2) & _LANE_LOW_BITS & board_two_suited:
+            flush_draw = 0.26
+
+        best_run = _BEST_RUN[board_ranks | _RANK_BIT[c1] | _RANK_BIT[c2]]
+        if best_run >= 4:
+            straight_draw = 0.25
+        elif best_run == 3:
+            straight_draw = 0.12
+
+    overcard_bonus = 0.0
+    if n_board == 3:
+        overcards = (_RANK_BIT[c1] > board_high_bit) + (_RANK_BIT[c2] > board_high_bit)
+        overcard_bonus = overcards * 0.06
+
+    return _clamp(flush_draw + straight_draw + overcard_bonus, 0.0, 0.75)
+
+
+def _combo_draw_strength(combo_cards: tuple[str, str], board: List[str]) -> float:
+    if len(board) < 3:
+        return 0.0
+    return _draw_strength_on(_board_draw_context(board), combo_cards[0], combo_cards[1])
+
+
+def _combo_postflop_strength(
+    combo_cards: tuple[str, str],
+    board: List[str],
+    street: str,
+    draw: Optional[float] = None,
+) -> float:
+    if street == "preflop" or len(board) < 3:
+        pre = PREFLOP_STRENGTH_TABLE[CARD_INDEX[combo_cards[0]] * 52 + CARD_INDEX[combo_cards[1]]]
+        return _clamp(pre, 0.0, 1.0)
+    rank = best_hand_rank(list(combo_cards) + list(board))
+    category = rank[0] / 8.0
+    kicker = rank[1][0] / 14.0 if rank[1] else 0.0
+    if draw is None:
+        draw = _combo_draw_strength(combo_cards, board)
+    return _clamp(category * 0.80 + kicker * 0.11 + draw * 0.42, 0.0, 1.35)
+
+
+def _range_postflop_features(
+    combos: List[tuple[str, str]],
+    board: List[str],
+    street: str,
+) -> tuple[List[float], List[float]]:
+    """Bulk ``(_combo_postflop_strength, _combo_draw_strength)`` columns for one board.
+
+    Board-only work (the draw context, board codes for hand ranking) is done once
+    here instead of once per combo.
+    """
+    n_board = len(board)
+    if n_board < 3:
+        draws = [0.0] * len(combos)
+        strengths = [
+            _clamp(PREFLOP_STRENGTH_TABLE[CARD_INDEX[c1] * 52 + CARD_INDEX[c2]], 0.0, 1.0)
+            for c1, c2 in combos
+        ]
+        return strengths, draws
+
+    draw_ctx = _board_draw_context(board)
+    draws = [_draw_strength_on(draw_ctx, c1, c2) for c1, c2 in combos]
+
+    if street == "preflop":
+        strengths = [
+            _clamp(PREFLOP_STRENGTH_TABLE[CARD_INDEX[c1] * 52 + CARD_INDEX[c2]], 0.0, 1.0)
+            for c1, c2 in combos
+        ]
+        return strengths, draws
+    strengths = []
+    for rank, draw in zip(best_hand_ranks(combos, board), draws):
+        category = rank[0] / 8.0
+        kicker = rank[1][0] / 14.0 if rank[1] else 0.0
+        strengths.append(_clamp(category * 0.80 + kicker * 0.11 + draw * 0.42, 0.0, 1.35))
+    return strengths, draws
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpponentProfile:
     """Normalized opponent profile used by live-play decision logic."""
 
@@ -109,6 +330,7 @@ class OpponentProfile:
     w_sd: float = 0.51
     tendencies: List[str] = field(default_factory=list)
     exploits: List[dict] = field(default_factory=list)
+    _dict_cache: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, raw: dict) -> "OpponentProfile":
@@ -158,8 +380,170 @@ class OpponentProfile:
             "exploits": self.exploits,
         }
 
+    @property
+    def as_dict(self) -> dict:
+        """Memoized ``to_dict()``; the profile never changes after construction, treat as read-only."""
+        cached = self._dict_cache
+        if cached is None:
+            cached = self.to_dict()
+            object.__setattr__(self, "_dict_cache", cached)
+        return cached
+
+
+@dataclass(frozen=True, slots=True)
+class OpponentCoeffs:
+    """Opponent-only terms of the villain decision formulas, computed once per session."""
+
+    gap: float
+    range_vpip_rate: float
+    range_pfr_rate: float
+    range_three_rate: float
+    range_limp_bias: float
+    preflop_fold_image_w: float
+    preflop_call_image_w: float
+    bet_base_by_street: tuple[float, ...]
+    station_adj: float
+    continue_image_w: float
+    raise_share_base: float
+    threebet_range_w: float
+    limp_call_mult: float
+    wtsd_bet_w: float
+    raise_noise_pre: float
+    threebet_noise_raise: float
+    threebet_noise_open: float
+    call_noise_pre: float
+    call_image_pre: float
+    fold_noise_pre: float
+    bet_noise_by_street: tuple[float, ...]
+    check_noise: float
+    call_noise_post: float
+    call_image_post: float
+    raise_noise_post: float
+    fold_wtsd_w: float
+    cbet_by_street: tuple[float, ...]
+    lead_bet_by_street: tuple[float, ...]
+    af_bet_bonus: float
+    open_raise_af_w: float
+    open_raise_limp_w: float
+    sticky: float
+    fold_to_3bet_w: float
+    is_calling: bool
+    is_calling_station: bool
+    is_passive_style: bool
+    is_tag_style: bool
+
+    @classmethod
+    def from_profile(cls, opp: OpponentProfile) -> "OpponentCoeffs":
+        gap = max(0.0, opp.vpip - opp.pfr)
+        style = opp.style_label.lower()
+        return cls(
+            gap=gap,
+            range_vpip_rate=_clamp(opp.vpip + 0.02, 0.08, 0.94),
+            range_pfr_rate=_clamp(opp.pfr + opp.three_bet * 0.30, 0.04, 0.82),
+            range_three_rate=_clamp(opp.three_bet * 2.2, 0.02, 0.50),
+            range_limp_bias=_clamp(opp.limp_rate * 0.7, 0.0, 0.55),
+            preflop_fold_image_w=0.15 + gap * 0.18,
+            preflop_call_image_w=0.12 + gap * 0.28,
+            # Per-street tuples are indexed by street id; the preflop slot is unused.
+            bet_base_by_street=(
+                0.0,
+                opp.flop_cbet * 0.40 + opp.aggression_frequency * 0.24,
+                opp.turn_cbet * 0.40 + opp.aggression_frequency * 0.24,
+                opp.river_cbet * 0.40 + opp.aggression_frequency * 0.24,
+            ),
+            station_adj=(opp.wtsd - 0.30) * 0.38 + (opp.vpip - opp.pfr) * 0.52,
+            continue_image_w=0.20 + gap * 0.34 + opp.wtsd * 0.22,
+            raise_share_base=opp.check_raise * 0.75 + max(0.0, opp.af - 2.5) * 0.07,
+            threebet_range_w=opp.three_bet * 0.32,
+            limp_call_mult=1.0 + opp.limp_rate * 0.25,
+            wtsd_bet_w=opp.wtsd * 0.10,
+            raise_noise_pre=opp.pfr * 0.95,
+            threebet_noise_raise=opp.three_bet * 0.55,
+            threebet_noise_open=opp.three_bet * 0.20,
+            call_noise_pre=max(0.03, opp.vpip - opp.pfr) + opp.limp_rate * 0.35,
+            call_image_pre=0.10 + opp.wtsd * 0.16,
+            fold_noise_pre=max(0.02, 1.0 - opp.vpip),
+            bet_noise_by_street=(
+                0.0,
+                opp.flop_cbet * 0.70 + opp.aggression_frequency * 0.25,
+                opp.turn_cbet * 0.70 + opp.aggression_frequency * 0.25,
+                opp.river_cbet * 0.70 + opp.aggression_frequency * 0.25,
+            ),
+            check_noise=0.42 + opp.wtsd * 0.20,
+            call_noise_post=opp.wtsd * 0.55 + (opp.vpip - opp.pfr) * 0.62,
+            call_image_post=0.12 + opp.wtsd * 0.20,
+            raise_noise_post=opp.check_raise * 0.80 + max(0.0, opp.af - 2.6) * 0.08,
+            fold_wtsd_w=opp.wtsd * 0.20,
+            cbet_by_street=(0.0, opp.flop_cbet, opp.turn_cbet, opp.river_cbet),
+            lead_bet_by_street=(
+                0.26 + opp.pfr * 0.25,
+                0.20 + opp.aggression_frequency * 0.40,
+                0.16 + opp.aggression_frequency * 0.34,
+                0.12 + opp.aggression_frequency * 0.28,
+            ),
+            af_bet_bonus=max(0.0, opp.af - 2.0) * 0.04,
+            open_raise_af_w=max(0.0, opp.af - 2.8) * 0.15,
+            open_raise_limp_w=opp.limp_rate * 0.35,
+            sticky=_clamp(0.22 + opp.wtsd * 0.45 + gap * 0.68 - opp.af * 0.05, 0.05, 0.96),
+            fold_to_3bet_w=opp.fold_to_3bet * 0.42,
+            is_calling="calling" in style,
+            is_calling_station="calling station" in style,
+            is_passive_style="calling station" in style or "loose-passive" in style,
+            is_tag_style="tag" in style,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
+class DecisionContext:
+    """Combo-independent inputs shared by every range entry for one villain decision."""
+
+    street: str
+    street_id: int
+    board: List[str]
+    pot: float
+    call_amount: float
+    hero_checked: bool
+    is_raise: bool
+    hero_image_adj: float
+    preflop_fold_adj: float = 0.0
+    preflop_call_adj: float = 0.0
+    bet_base: float = 0.0
+    texture_penalty: float = 0.0
+    required_equity: float = 0.0
+    station_adj: float = 0.0
+    hero_image_continue: float = 0.0
+    raise_share_base: float = 0.0
+
+
+@dataclass(slots=True)
+class RangeTable:
+    """Column-oriented villain range; index ``i`` of every list describes one combo."""
+
+    cards: List[tuple[str, str]]
+    keys: List[str]
+    pre_score: List[float]
+    strength_q: List[float]
+    play_prob: List[float]
+    raise_prob: List[float]
+    call_prob: List[float]
+    threebet_prob: List[float]
+    weight: List[float]
+
+    def row(self, idx: int) -> "RangeTable":
+        return RangeTable(
+            cards=[self.cards[idx]],
+            keys=[self.keys[idx]],
+            pre_score=[self.pre_score[idx]],
+            strength_q=[self.strength_q[idx]],
+            play_prob=[self.play_prob[idx]],
+            raise_prob=[self.raise_prob[idx]],
+            call_prob=[self.call_prob[idx]],
+            threebet_prob=[self.threebet_prob[idx]],
+            weight=[self.weight[idx]],
+        )
+
+
+@dataclass(slots=True)
 class LiveHand:
     """One simulated hand in an interactive session."""
 
@@ -172,16 +556,17 @@ class LiveHand:
     full_board: List[str]
     hero_hand: List[str]
     villain_hand: List[str]
-    pot_bb: float
+    pot_dbb: int
     to_call_bb: float
     action_context: str
     legal_actions: List[str]
     size_options_bb: List[float]
-    action_history: List[str]
-    hero_remaining_bb: float
-    villain_remaining_bb: float
-    hero_invested_bb: float
-    villain_invested_bb: float
+    action_history: List[str | tuple]
+    # Pot and stacks are tracked in integer deci-bb so commits never accumulate float error.
+    hero_remaining_dbb: int
+    villain_remaining_dbb: int
+    hero_invested_dbb: int
+    villain_invested_dbb: int
     preflop_aggressor: str = "none"
     hero_first_this_street: bool = False
     hero_phase: str = "initial"
@@ -190,6 +575,41 @@ class LiveHand:
     hero_delta_bb: float = 0.0
     showdown: Optional[dict] = None
     villain_range_summary: dict = field(default_factory=dict)
+    # Villain's hole cards never change mid-hand, so the range lookups are resolved once.
+    villain_combo: tuple[str, str] = field(default=("", ""), repr=False)
+    villain_range_idx: Optional[int] = field(default=None, repr=False)
+    villain_strength_q: float = field(default=0.5, repr=False)
+    # Refreshed by set_board(); the board only changes when a street is dealt.
+    board_texture: float = field(default=0.0, init=False, repr=False)
+    street_id: int = field(default=_PREFLOP, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.board_texture = board_texture_score(self.board)
+        self.street_id = _STREET_ID[self.street]
+
+    def set_board(self, board: List[str]) -> None:
+        self.board = board
+        self.board_texture = board_texture_score(board)
+
+    @property
+    def pot_bb(self) -> float:
+        return self.pot_dbb / 10.0
+
+    @property
+    def hero_remaining_bb(self) -> float:
+        return self.hero_remaining_dbb / 10.0
+
+    @property
+    def villain_remaining_bb(self) -> float:
+        return self.villain_remaining_dbb / 10.0
+
+    @property
+    def hero_invested_bb(self) -> float:
+        return self.hero_invested_dbb / 10.0
+
+    @property
+    def villain_invested_bb(self) -> float:
+        return self.villain_invested_dbb / 10.0
 
     def to_public(self) -> dict:
         out = {
@@ -204,7 +624,7 @@ class LiveHand:
             "action_context": self.action_context,
             "legal_actions": list(self.legal_actions),
             "size_options_bb": [round(v, 1) for v in self.size_options_bb],
-            "action_history": list(self.action_history),
+            "action_history": [_format_history_entry(e) for e in self.action_history],
             "hand_over": self.hand_over,
             "hero_delta_bb": round(self.hero_delta_bb, 3),
             "villain_range_summary": dict(self.villain_range_summary or {}),
@@ -232,6 +652,7 @@ class LiveMatch:
         self.seed = int(seed or random.randint(1, 10_000_000))
         self.rng = random.Random(self.seed)
         self.opponent = OpponentProfile.from_dict(opponent_profile)
+        self._coeffs = OpponentCoeffs.from_profile(self.opponent)
         self.starting_stack_bb = _clamp(float(starting_stack_bb), 20.0, 400.0)
         self.sb = _clamp(float(sb), 0.1, 10.0)
         self.bb = _clamp(float(bb), self.sb + 0.1, 20.0)
@@ -253,15 +674,21 @@ class LiveMatch:
             "aggr_size_samples": 0,
             "recent_aggr_flags": [],
         }
+        # Hero image only moves when hero acts (see _record_hero_action); decisions read this.
+        self._hero_image_value = self._hero_image_score()
         self.current_hand: Optional[LiveHand] = None
-        self._range_entries: List[dict] = []
-        self._range_index: Dict[tuple[str, str], dict] = {}
-        self._range_adherence_value: float = 0.65
+        self._range: Optional[RangeTable] = None
+        self._range_index: Dict[tuple[str, str], int] = {}
+        self._range_features_cache: Dict[tuple, tuple[List[float], List[float]]] = {}
+        self._range_summary_pending: Optional[tuple] = None
+        # Adherence depends on the opponent profile alone.
+        self._range_adherence_value = self._range_adherence()
         self.start_next_hand()
 
     def state(self) -> dict:
         if self.current_hand is None:
             raise ValueError("No active hand")
+        self._flush_range_summary()
         return {
             "session_id": self.session_id,
             "seed": self.seed,
@@ -273,7 +700,7 @@ class LiveMatch:
                 "hero_bankroll_bb": round(self.starting_stack_bb + self.hero_net_bb, 3),
                 "villain_bankroll_bb": round(self.starting_stack_bb - self.hero_net_bb, 3),
                 "mode": self.mode,
-                "opponent": self.opponent.to_dict(),
+                "opponent": self.opponent.as_dict,
             },
             "hand": self.current_hand.to_public(),
         }
@@ -316,7 +743,7 @@ class LiveMatch:
 
         if act == "call":
             commit = self._hero_commit(hand.to_call_bb)
-            hand.action_history.append(f"Hero calls {commit:.1f}bb.")
+            hand.action_history.append(("hero_calls", commit))
             hand.to_call_bb = 0.0
             if self._is_all_in():
                 self._resolve_showdown()
@@ -334,7 +761,7 @@ class LiveMatch:
 
         if act == "bet":
             commit = self._hero_commit(size_bb or 0.0)
-            hand.action_history.append(f"Hero bets {commit:.1f}bb ({(intent or 'value').lower()}).")
+            hand.action_history.append(("hero_bets", commit, (intent or "value").lower()))
             self._set_preflop_aggressor("hero")
             self._villain_response_to_hero_aggression(hero_action_amount=commit, previous_to_call=0.0, is_raise=False)
             return self.state()
@@ -342,7 +769,7 @@ class LiveMatch:
         if act == "raise":
             prev_to_call = hand.to_call_bb
             commit = self._hero_commit(size_bb or 0.0)
-            hand.action_history.append(f"Hero raises {commit:.1f}bb ({(intent or 'value').lower()}).")
+            hand.action_history.append(("hero_raises", commit, (intent or "value").lower()))
             self._set_preflop_aggressor("hero")
             self._villain_response_to_hero_aggression(
                 hero_action_amount=commit,
@@ -357,14 +784,8 @@ class LiveMatch:
         self._button_on_hero = bool(self.hands_played % 2 == 1)
         hero_position = "BTN" if self._button_on_hero else "BB"
 
-        deck = full_deck()
-        hero_hand = self.rng.sample(deck, 2)
-        for c in hero_hand:
-            deck.remove(c)
-        villain_hand = self.rng.sample(deck, 2)
-        for c in villain_hand:
-            deck.remove(c)
-        full_board = self.rng.sample(deck, 5)
+        draw = self.rng.sample(full_deck(), 9)
+        hero_hand, villain_hand, full_board = draw[:2], draw[2:4], draw[4:]
 
         hand = LiveHand(
             hand_no=self.hands_played,
@@ -376,16 +797,16 @@ class LiveMatch:
             full_board=full_board,
             hero_hand=hero_hand,
             villain_hand=villain_hand,
-            pot_bb=0.0,
+            pot_dbb=0,
             to_call_bb=0.0,
             action_context="checked_to_hero",
             legal_actions=[],
             size_options_bb=[],
             action_history=[],
-            hero_remaining_bb=self.starting_stack_bb,
-            villain_remaining_bb=self.starting_stack_bb,
-            hero_invested_bb=0.0,
-            villain_invested_bb=0.0,
+            hero_remaining_dbb=_to_dbb(self.starting_stack_bb),
+            villain_remaining_dbb=_to_dbb(self.starting_stack_bb),
+            hero_invested_dbb=0,
+            villain_invested_dbb=0,
             preflop_aggressor="none",
             hero_first_this_street=self._hero_first_on_street("preflop"),
             hero_phase="initial",
@@ -394,21 +815,21 @@ class LiveMatch:
         self.current_hand = hand
         self._init_range_model()
         hand.action_history.append(
-            f"Hand {hand.hand_no}: Hero ({hero_position}) vs {self.opponent.name} ({self.opponent.style_label})."
+            ("hand_intro", hand.hand_no, hero_position, self.opponent.name, self.opponent.style_label)
         )
 
         if self._button_on_hero:
             hero_sb = self._hero_commit(self.sb)
             villain_bb = self._villain_commit(self.bb)
-            hand.action_history.append(f"Hero posts SB {hero_sb:.1f}bb.")
-            hand.action_history.append(f"Villain posts BB {villain_bb:.1f}bb.")
+            hand.action_history.append(("hero_posts_sb", hero_sb))
+            hand.action_history.append(("villain_posts_bb", villain_bb))
             hand.to_call_bb = _round1(max(0.0, self.bb - self.sb))
             hand.action_context = "facing_bet"
         else:
             villain_sb = self._villain_commit(self.sb)
             hero_bb = self._hero_commit(self.bb)
-            hand.action_history.append(f"Villain posts SB {villain_sb:.1f}bb.")
-            hand.action_history.append(f"Hero posts BB {hero_bb:.1f}bb.")
+            hand.action_history.append(("villain_posts_sb", villain_sb))
+            hand.action_history.append(("hero_posts_bb", hero_bb))
             self._villain_preflop_first_action()
 
         if not hand.hand_over:
@@ -431,14 +852,17 @@ class LiveMatch:
 
         scenario = generate_scenario(payload)
         deck = remove_cards(full_deck(), scenario["hero_hand"] + scenario["board"])
-        villain_hand = self.rng.sample(deck, 2)
-        for c in villain_hand:
-            deck.remove(c)
         full_board = list(scenario["board"])
-        if len(full_board) < 5:
-            full_board.extend(self.rng.sample(deck, 5 - len(full_board)))
+        draw = self.rng.sample(deck, 2 + max(0, 5 - len(full_board)))
+        villain_hand = draw[:2]
+        full_board.extend(draw[2:])
 
         hero_position = str(scenario["hero_position"])
+        stack_dbb = _to_dbb(self.starting_stack_bb)
+        # Both players invested half the seeded pot; an odd deci-bb pot is rounded up to an
+        # even one so neither side ends up 0.1 bb deeper than the other.
+        share_dbb = (_to_dbb(scenario["pot_bb"]) + 1) // 2
+        pot_dbb = 2 * share_dbb
         hand = LiveHand(
             hand_no=self.hands_played,
             mode="targeted",
@@ -449,16 +873,16 @@ class LiveMatch:
             full_board=full_board,
             hero_hand=list(scenario["hero_hand"]),
             villain_hand=villain_hand,
-            pot_bb=float(scenario["pot_bb"]),
+            pot_dbb=pot_dbb,
             to_call_bb=float(scenario["to_call_bb"]),
             action_context=str(scenario["action_context"]),
             legal_actions=list(scenario["legal_actions"]),
             size_options_bb=list(scenario.get("raise_size_options_bb", []) or scenario.get("bet_size_options_bb", [])),
             action_history=list(scenario.get("action_history", [])),
-            hero_remaining_bb=max(0.0, self.starting_stack_bb - float(scenario["pot_bb"]) / 2.0),
-            villain_remaining_bb=max(0.0, self.starting_stack_bb - float(scenario["pot_bb"]) / 2.0),
-            hero_invested_bb=float(scenario["pot_bb"]) / 2.0,
-            villain_invested_bb=float(scenario["pot_bb"]) / 2.0,
+            hero_remaining_dbb=max(0, stack_dbb - share_dbb),
+            villain_remaining_dbb=max(0, stack_dbb - share_dbb),
+            hero_invested_dbb=share_dbb,
+            villain_invested_dbb=share_dbb,
             preflop_aggressor="unknown",
             hero_first_this_street=self._hero_first_on_street(str(scenario["street"]), hero_position == "BTN"),
             hero_phase="initial",
@@ -466,7 +890,7 @@ class LiveMatch:
         )
         self.current_hand = hand
         self._init_range_model()
-        hand.action_history.append(f"Targeted spot loaded vs {self.opponent.name}.")
+        hand.action_history.append(("targeted_loaded", self.opponent.name))
         self._update_legal_options()
         return hand
 
@@ -509,6 +933,7 @@ class LiveMatch:
         recent.append(1 if is_aggr else 0)
         if len(recent) > 12:
             del recent[0]
+        self._hero_image_value = self._hero_image_score()
 
     def _hero_image_score(self) -> float:
         """0..1 perceived hero aggression/bluffiness based on observed actions."""
@@ -538,10 +963,9 @@ class LiveMatch:
         af_over = max(0.0, self.opponent.af - 2.3)
         passive_bonus = max(0.0, 1.9 - self.opponent.af) * 0.05
         base = 0.84 - gap * 0.58 - af_over * 0.08 + passive_bonus
-        style = self.opponent.style_label.lower()
-        if "calling station" in style or "loose-passive" in style:
+        if self._coeffs.is_passive_style:
             base -= 0.06
-        if "tag" in style:
+        if self._coeffs.is_tag_style:
             base += 0.05
         return _clamp(base, 0.35, 0.93)
 
@@ -551,279 +975,289 @@ class LiveMatch:
             return
         known_cards = hand.hero_hand + hand.board
         deck = remove_cards(full_deck(), known_cards)
-        combos = list(itertools.combinations(deck, 2))
-        if not combos:
-            self._range_entries = []
+        self._range_features_cache = {}
+        hand.villain_combo = _canonical_combo(hand.villain_hand)
+        hand.villain_range_idx = None
+        hand.villain_strength_q = 0.5
+        if len(deck) < 2:
+            self._range = None
             self._range_index = {}
+            self._range_summary_pending = None
             hand.villain_range_summary = {}
             return
 
-        scored = []
-        for combo in combos:
-            pre_score = preflop_strength_score(combo[0], combo[1]) / 100.0
-            scored.append((combo, pre_score))
+        # Enumerate unordered (i < j) index pairs and score straight from the lookup table.
+        ids = [CARD_INDEX[c] for c in deck]
+        n_cards = len(deck)
+        scored = [
+            ((deck[i], deck[j]), PREFLOP_STRENGTH_TABLE[ids[i] * 52 + ids[j]])
+            for i in range(n_cards - 1)
+            for j in range(i + 1, n_cards)
+        ]
         scored.sort(key=lambda x: x[1], reverse=True)
 
         n = len(scored)
-        vpip_rate = _clamp(self.opponent.vpip + 0.02, 0.08, 0.94)
-        pfr_rate = _clamp(self.opponent.pfr + self.opponent.three_bet * 0.30, 0.04, 0.82)
-        three_rate = _clamp(self.opponent.three_bet * 2.2, 0.02, 0.50)
-        limp_bias = _clamp(self.opponent.limp_rate * 0.7, 0.0, 0.55)
-
-        entries: List[dict] = []
+        coeffs = self._coeffs
+        vpip_rate = coeffs.range_vpip_rate
+        pfr_rate = coeffs.range_pfr_rate
+        three_rate = coeffs.range_three_rate
+        limp_bias = coeffs.range_limp_bias
+
+        # The three seeding sigmoids run for every combo; inline them (same
+        # arithmetic as _sigmoid) and hoist the per-profile offsets.
+        exp = math.exp
+        vpip_cut = 1.0 - vpip_rate
+        pfr_cut = 1.0 - pfr_rate
+        three_cut = 1.0 - three_rate
+        table = RangeTable([], [], [], [], [], [], [], [], [])
         for idx, (combo, pre_score) in enumerate(scored):
             strength_q = 1.0 - (idx / max(1, n - 1))
-            play_prob = _clamp(_sigmoid((strength_q - (1.0 - vpip_rate)) / 0.09), 0.001, 0.999)
-            raise_prob = _clamp(_sigmoid((strength_q - (1.0 - pfr_rate)) / 0.08), 0.001, 0.995)
-            threebet_prob = _clamp(_sigmoid((strength_q - (1.0 - three_rate)) / 0.07), 0.001, 0.92)
+            play_prob = _clamp(1.0 / (1.0 + exp(-((strength_q - vpip_cut) / 0.09))), 0.001, 0.999)
+            raise_prob = _clamp(1.0 / (1.0 + exp(-((strength_q - pfr_cut) / 0.08))), 0.001, 0.995)
+            threebet_prob = _clamp(1.0 / (1.0 + exp(-((strength_q - three_cut) / 0.07))), 0.001, 0.92)
             call_prob = _clamp(play_prob - raise_prob * (0.80 - limp_bias * 0.2) + limp_bias * 0.06, 0.001, 0.995)
-            entry = {
-                "cards": _canonical_combo(combo),
-                "key": _combo_key(combo),
-                "pre_score": pre_score,
-                "strength_q": strength_q,
-                "play_prob": play_prob,
-                "raise_prob": raise_prob,
-                "call_prob": call_prob,
-                "threebet_prob": threebet_prob,
-                "weight": play_prob,
-            }
-            entries.append(entry)
-
-        total = sum(e["weight"] for e in entries)
-        if total > 0:
-            for e in entries:
-                e["weight"] /= total
-
-        self._range_entries = entries
-        self._range_index = {e["cards"]: e for e in entries}
-        self._range_adherence_value = self._range_adherence()
+            table.cards.append(_canonical_combo(combo))
+            table.keys.append(_combo_key(combo))
+            table.pre_score.append(pre_score)
+            table.strength_q.append(strength_q)
+            table.play_prob.append(play_prob)
+            table.raise_prob.append(raise_prob)
+            table.call_prob.append(call_prob)
+            table.threebet_prob.append(threebet_prob)
+
+        total = sum(table.play_prob)
+        table.weight = [w / total for w in table.play_prob] if total > 0 else list(table.play_prob)
+
+        self._range = table
+        self._range_index = {cards: i for i, cards in enumerate(table.cards)}
+        hand.villain_range_idx = self._range_index.get(hand.villain_combo)
+        if hand.villain_range_idx is not None:
+            hand.villain_strength_q = table.strength_q[hand.villain_range_idx]
         self._refresh_range_summary(event="range_seeded")
 
-    def _combo_draw_strength(self, combo_cards: tuple[str, str], board: List[str]) -> float:
-        if len(board) < 3:
-            return 0.0
-        cards = list(combo_cards) + list(board)
-
-        suit_counts: Dict[str, int] = {}
-        board_suits: Dict[str, int] = {}
-        for c in cards:
-            s = card_suit(c)
-            suit_counts[s] = suit_counts.get(s, 0) + 1
-        for c in board:
-            s = card_suit(c)
-            board_suits[s] = board_suits.get(s, 0) + 1
-        max_suit = max(suit_counts.values())
-        flush_draw = 0.0
-        if len(board) < 5:
-            for s, count in suit_counts.items():
-                if count >= 4 and board_suits.get(s, 0) >= 2:
-                    flush_draw = 0.26
-                    break
-
-        ranks = sorted({card_rank(c) for c in cards})
-        if 14 in ranks:
-            ranks.append(1)
-        best_run = 1
-        run = 1
-        for i in range(1, len(ranks)):
-            if ranks[i] == ranks[i - 1] + 1:
-                run += 1
-                best_run = max(best_run, run)
-            elif ranks[i] != ranks[i - 1]:
-                run = 1
-        straight_draw = 0.0
-        if len(board) < 5:
-            if best_run >= 4:
-                straight_draw = 0.25
-            elif best_run == 3:
-                straight_draw = 0.12
-
-        overcard_bonus = 0.0
-        if len(board) == 3:
-            board_high = max(card_rank(c) for c in board)
-            overcards = sum(1 for c in combo_cards if card_rank(c) > board_high)
-            overcard_bonus = overcards * 0.06
-
-        return _clamp(flush_draw + straight_draw + overcard_bonus, 0.0, 0.75)
-
-    def _combo_postflop_strength(self, combo_cards: tuple[str, str], board: List[str], street: str) -> float:
-        if street == "preflop":
-            return _clamp(preflop_strength_score(combo_cards[0], combo_cards[1]) / 100.0, 0.0, 1.0)
-        if len(board) < 3:
-            return _clamp(preflop_strength_score(combo_cards[0], combo_cards[1]) / 100.0, 0.0, 1.0)
-        rank = best_hand_rank(list(combo_cards) + list(board))
-        category = rank[0] / 8.0
-        kicker = rank[1][0] / 14.0 if rank[1] else 0.0
-        draw = self._combo_draw_strength(combo_cards, board)
-        return _clamp(category * 0.80 + kicker * 0.11 + draw * 0.42, 0.0, 1.35)
-
-    def _combo_action_probability(
+    def _precompute_decision_context(
         self,
-        entry: dict,
-        action: str,
         call_amount: float,
         hero_checked: bool,
         is_raise: bool,
-    ) -> float:
+    ) -> Optional[DecisionContext]:
+        """Compute the combo-independent inputs for one villain decision."""
         hand = self.current_hand
         if hand is None:
-            return 0.1
+            return None
+        coeffs = self._coeffs
         street = hand.street
-        action = str(action)
+        street_id = hand.street_id
+        pot = max(1.0, hand.pot_bb)
         call_amount = max(0.0, float(call_amount))
-        hero_image = self._hero_image_score()
-        hero_image_adj = hero_image - 0.5
-
-        if street == "preflop":
-            play_prob = entry.get("play_prob", 0.35)
-            raise_prob = entry.get("raise_prob", 0.18)
-            call_prob = entry.get("call_prob", 0.20)
-            threebet_prob = entry.get("threebet_prob", 0.08)
-            if action == "fold":
-                fold_p = 1.0 - play_prob
-                if call_amount > 0:
-                    fold_p -= hero_image_adj * (0.15 + max(0.0, self.opponent.vpip - self.opponent.pfr) * 0.18)
-                return _clamp(fold_p, 0.001, 0.995)
-            if action == "raise":
-                base_raise = raise_prob
-                if is_raise:
-                    base_raise = _clamp(threebet_prob + self.opponent.three_bet * 0.32 + raise_prob * 0.24, 0.01, 0.95)
-                    base_raise += hero_image_adj * 0.06
-                return _clamp(base_raise, 0.001, 0.95)
-            if action == "call":
-                cp = call_prob * (1.0 + self.opponent.limp_rate * 0.25)
-                if call_amount > 0:
-                    cp += hero_image_adj * (0.12 + max(0.0, self.opponent.vpip - self.opponent.pfr) * 0.28)
-                return _clamp(cp, 0.001, 0.95)
-            if action == "check":
-                return _clamp(call_prob + (1.0 - play_prob) * 0.45, 0.001, 0.95)
-            return 0.01
+        hero_image_adj = self._hero_image_value - 0.5
+
+        if street_id == _PREFLOP:
+            return DecisionContext(
+                street=street,
+                street_id=street_id,
+                board=hand.board,
+                pot=pot,
+                call_amount=call_amount,
+                hero_checked=hero_checked,
+                is_raise=is_raise,
+                hero_image_adj=hero_image_adj,
+                preflop_fold_adj=hero_image_adj * coeffs.preflop_fold_image_w,
+                preflop_call_adj=hero_image_adj * coeffs.preflop_call_image_w,
+            )
 
         board = hand.board
-        pot = max(1.0, hand.pot_bb)
-        draw = self._combo_draw_strength(entry["cards"], board)
-        strength = self._combo_postflop_strength(entry["cards"], board, street)
-        texture = board_texture_score(board)
-
-        if street == "flop":
-            street_base = self.opponent.flop_cbet
-        elif street == "turn":
-            street_base = self.opponent.turn_cbet
-        else:
-            street_base = self.opponent.river_cbet
-
-        bet_prob = (
-            street_base * 0.40
-            + self.opponent.aggression_frequency * 0.24
-            + strength * 0.42
-            + draw * 0.20
-            - self.opponent.wtsd * 0.10
-            - texture * (0.02 if street in {"turn", "river"} else 0.0)
+        texture = hand.board_texture
+        return DecisionContext(
+            street=street,
+            street_id=street_id,
+            board=board,
+            pot=pot,
+            call_amount=call_amount,
+            hero_checked=hero_checked,
+            is_raise=is_raise,
+            hero_image_adj=hero_image_adj,
+            bet_base=coeffs.bet_base_by_street[street_id],
+            texture_penalty=texture * (0.02 if street_id >= _TURN else 0.0),
+            required_equity=call_amount / max(1.0, pot + call_amount),
+            station_adj=coeffs.station_adj,
+            hero_image_continue=hero_image_adj * coeffs.continue_image_w,
+            raise_share_base=coeffs.raise_share_base,
         )
-        bet_prob -= hero_image_adj * 0.06
-        if hero_checked:
-            bet_prob += 0.10
-        bet_prob = _clamp(bet_prob, 0.01, 0.98)
-
-        if action == "check":
-            return _clamp(1.0 - bet_prob, 0.01, 0.98)
-        if action == "bet":
-            return _clamp(bet_prob, 0.01, 0.98)
-
-        if action in {"call", "fold", "raise"}:
-            required_equity = call_amount / max(1.0, pot + call_amount)
-            eq_proxy = _clamp(0.12 + strength * 0.66 + draw * 0.22, 0.0, 0.99)
-            continue_prob = _sigmoid((eq_proxy - required_equity) / 0.11)
-            station_adj = (self.opponent.wtsd - 0.30) * 0.38 + (self.opponent.vpip - self.opponent.pfr) * 0.52
-            hero_image_continue = hero_image_adj * (
-                0.20 + max(0.0, self.opponent.vpip - self.opponent.pfr) * 0.34 + self.opponent.wtsd * 0.22
-            )
-            continue_prob = _clamp(continue_prob + station_adj, 0.01, 0.99)
-            continue_prob = _clamp(continue_prob + hero_image_continue, 0.01, 0.99)
-            raise_share = _clamp(
-                self.opponent.check_raise * 0.75 + max(0.0, self.opponent.af - 2.5) * 0.07 + max(0.0, strength - 0.80) * 0.30,
-                0.01,
-                0.55,
-            )
-            if action == "raise":
-                return _clamp(continue_prob * raise_share, 0.001, 0.80)
-            if action == "call":
-                return _clamp(continue_prob * (1.0 - raise_share), 0.001, 0.98)
-            return _clamp(1.0 - continue_prob, 0.001, 0.98)
-        return 0.01
-
-    def _range_action_shares(
+
+    def _range_strength_features(
         self,
+        table: RangeTable,
+        board: List[str],
+        street: str,
+    ) -> tuple[List[float], List[float]]:
+        """Per-combo (postflop strength, draw strength) columns for ``table``.
+
+        Columns for the live range are cached per (street, board); they only change
+        when a new street is dealt or the range is reseeded.
+        """
+        cache_key = (street, tuple(board))
+        shared = table is self._range
+        if shared:
+            cached = self._range_features_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        strengths, draws = _range_postflop_features(table.cards, board, street)
+        if shared:
+            self._range_features_cache[cache_key] = (strengths, draws)
+        return strengths, draws
+
+    def _range_action_probs(
+        self,
+        table: RangeTable,
+        ctx: DecisionContext,
         actions: List[str],
-        call_amount: float,
-        hero_checked: bool,
-        is_raise: bool,
-    ) -> Dict[str, float]:
-        if not self._range_entries:
-            return {a: 1.0 / max(1, len(actions)) for a in actions}
-        totals = {a: 0.0 for a in actions}
-        for entry in self._range_entries:
-            w = entry.get("weight", 0.0)
+    ) -> Dict[str, List[float]]:
+        """Probability that each combo in ``table`` takes each action, one column per action."""
+        coeffs = self._coeffs
+        n = len(table.cards)
+        out: Dict[str, List[float]] = {}
+        if ctx.street_id == _PREFLOP:
+            facing = ctx.call_amount > 0
             for action in actions:
-                p = self._combo_action_probability(
-                    entry=entry,
-                    action=action,
-                    call_amount=call_amount,
-                    hero_checked=hero_checked,
-                    is_raise=is_raise,
+                if action == "fold":
+                    if facing:
+                        adj = ctx.preflop_fold_adj
+                        out[action] = [_clamp(1.0 - p - adj, 0.001, 0.995) for p in table.play_prob]
+                    else:
+                        out[action] = [_clamp(1.0 - p, 0.001, 0.995) for p in table.play_prob]
+                elif action == "raise":
+                    if ctx.is_raise:
+                        three_bet_w = coeffs.threebet_range_w
+                        image_w = ctx.hero_image_adj * 0.06
+                        out[action] = [
+                            _clamp(_clamp(t + three_bet_w + r * 0.24, 0.01, 0.95) + image_w, 0.001, 0.95)
+                            for t, r in zip(table.threebet_prob, table.raise_prob)
+                        ]
+                    else:
+                        out[action] = [_clamp(r, 0.001, 0.95) for r in table.raise_prob]
+                elif action == "call":
+                    limp_mult = coeffs.limp_call_mult
+                    if facing:
+                        adj = ctx.preflop_call_adj
+                        out[action] = [_clamp(c * limp_mult + adj, 0.001, 0.95) for c in table.call_prob]
+                    else:
+                        out[action] = [_clamp(c * limp_mult, 0.001, 0.95) for c in table.call_prob]
+                elif action == "check":
+                    out[action] = [
+                        _clamp(c + (1.0 - p) * 0.45, 0.001, 0.95)
+                        for c, p in zip(table.call_prob, table.play_prob)
+                    ]
+                else:
+                    out[action] = [0.01] * n
+            return out
+
+        strengths, draws = self._range_strength_features(table, ctx.board, ctx.street)
+        if "check" in actions or "bet" in actions:
+            wtsd_w = coeffs.wtsd_bet_w
+            image_w = ctx.hero_image_adj * 0.06
+            checked_bonus = 0.10 if ctx.hero_checked else 0.0
+            bet_probs = [
+                _clamp(
+                    ctx.bet_base + s * 0.42 + d * 0.20 - wtsd_w - ctx.texture_penalty - image_w + checked_bonus,
+                    0.01,
+                    0.98,
                 )
-                totals[action] += w * p
+                for s, d in zip(strengths, draws)
+            ]
+        if "call" in actions or "fold" in actions or "raise" in actions:
+            continue_probs = []
+            raise_shares = []
+            for s, d in zip(strengths, draws):
+                eq_proxy = _clamp(0.12 + s * 0.66 + d * 0.22, 0.0, 0.99)
+                continue_prob = _sigmoid((eq_proxy - ctx.required_equity) / 0.11)
+                continue_prob = _clamp(continue_prob + ctx.station_adj, 0.01, 0.99)
+                continue_probs.append(_clamp(continue_prob + ctx.hero_image_continue, 0.01, 0.99))
+                raise_shares.append(_clamp(ctx.raise_share_base + max(0.0, s - 0.80) * 0.30, 0.01, 0.55))
+
+        for action in actions:
+            if action == "check":
+                out[action] = [_clamp(1.0 - b, 0.01, 0.98) for b in bet_probs]
+            elif action == "bet":
+                out[action] = [_clamp(b, 0.01, 0.98) for b in bet_probs]
+            elif action == "raise":
+                out[action] = [_clamp(c * r, 0.001, 0.80) for c, r in zip(continue_probs, raise_shares)]
+            elif action == "call":
+                out[action] = [_clamp(c * (1.0 - r), 0.001, 0.98) for c, r in zip(continue_probs, raise_shares)]
+            elif action == "fold":
+                out[action] = [_clamp(1.0 - c, 0.001, 0.98) for c in continue_probs]
+            else:
+                out[action] = [0.01] * n
+        return out
+
+    def _range_action_shares(self, actions: List[str], ctx: DecisionContext) -> List[float]:
+        table = self._range
+        if table is None:
+            return [1.0 / max(1, len(actions))] * len(actions)
+        probs = self._range_action_probs(table, ctx, actions)
+        weights = table.weight
+        # Weighted range share per action is a dot product of the weight column with
+        # that action's probability column; map(mul) keeps it in C.
+        totals = [sum(map(operator.mul, weights, probs[a])) for a in actions]
         return _normalize_distribution(totals)
 
-    def _style_noise_distribution(
-        self,
-        actions: List[str],
-        call_amount: float,
-        hero_checked: bool,
-        is_raise: bool,
-    ) -> Dict[str, float]:
+    def _villain_row(self) -> RangeTable:
+        """Single-row range table for villain's actual holding."""
         hand = self.current_hand
-        if hand is None:
-            return {a: 1.0 / max(1, len(actions)) for a in actions}
-        pot = max(1.0, hand.pot_bb)
-        hero_image = self._hero_image_score()
-        hero_image_adj = hero_image - 0.5
-        out = {a: 0.01 for a in actions}
-
-        if hand.street == "preflop":
-            if "raise" in out:
-                out["raise"] += self.opponent.pfr * 0.95 + self.opponent.three_bet * (0.55 if is_raise else 0.20)
-            if "call" in out:
-                out["call"] += (
-                    max(0.03, self.opponent.vpip - self.opponent.pfr)
-                    + self.opponent.limp_rate * 0.35
-                    + hero_image_adj * (0.10 + self.opponent.wtsd * 0.16)
-                )
-            if "fold" in out:
-                out["fold"] += max(0.02, 1.0 - self.opponent.vpip) - hero_image_adj * 0.12
-            if "check" in out:
-                out["check"] += 0.30
+        combo = hand.villain_combo
+        idx = hand.villain_range_idx
+        if idx is not None:
+            return self._range.row(idx)
+        return RangeTable(
+            cards=[combo],
+            keys=[_combo_key(combo)],
+            pre_score=[preflop_strength_score(hand.villain_hand[0], hand.villain_hand[1]) / 100.0],
+            strength_q=[0.5],
+            play_prob=[_clamp(self.opponent.vpip, 0.05, 0.95)],
+            raise_prob=[_clamp(self.opponent.pfr, 0.02, 0.85)],
+            call_prob=[_clamp(self.opponent.vpip - self.opponent.pfr + 0.12, 0.02, 0.92)],
+            threebet_prob=[_clamp(self.opponent.three_bet * 2.0, 0.01, 0.75)],
+            weight=[1.0],
+        )
+
+    def _style_noise_distribution(self, actions: List[str], ctx: DecisionContext) -> List[float]:
+        coeffs = self._coeffs
+        hero_image_adj = ctx.hero_image_adj
+        out = []
+
+        if ctx.street_id == _PREFLOP:
+            for action in actions:
+                if action == "raise":
+                    v = coeffs.raise_noise_pre + (
+                        coeffs.threebet_noise_raise if ctx.is_raise else coeffs.threebet_noise_open
+                    )
+                elif action == "call":
+                    v = coeffs.call_noise_pre + hero_image_adj * coeffs.call_image_pre
+                elif action == "fold":
+                    v = coeffs.fold_noise_pre - hero_image_adj * 0.12
+                elif action == "check":
+                    v = 0.30
+                else:
+                    v = 0.0
+                out.append(0.01 + v)
             return _normalize_distribution(out)
 
-        if "bet" in out:
-            base_cbet = self.opponent.flop_cbet if hand.street == "flop" else self.opponent.turn_cbet if hand.street == "turn" else self.opponent.river_cbet
-            out["bet"] += base_cbet * 0.70 + self.opponent.aggression_frequency * 0.25 + (0.10 if hero_checked else 0.0) - hero_image_adj * 0.07
-        if "check" in out:
-            out["check"] += 0.42 + self.opponent.wtsd * 0.20 + hero_image_adj * 0.06
-        if "call" in out:
-            pressure = call_amount / max(1.0, pot)
-            out["call"] += (
-                self.opponent.wtsd * 0.55
-                + (self.opponent.vpip - self.opponent.pfr) * 0.62
-                - pressure * 0.15
-                + hero_image_adj * (0.12 + self.opponent.wtsd * 0.20)
-            )
-        if "raise" in out:
-            out["raise"] += self.opponent.check_raise * 0.80 + max(0.0, self.opponent.af - 2.6) * 0.08
-        if "fold" in out:
-            pressure = call_amount / max(1.0, pot)
-            out["fold"] += 0.34 + pressure * 0.28 - self.opponent.wtsd * 0.20 - hero_image_adj * 0.16
+        pressure = ctx.call_amount / ctx.pot
+        for action in actions:
+            if action == "bet":
+                base = coeffs.bet_noise_by_street[ctx.street_id]
+                v = base + (0.10 if ctx.hero_checked else 0.0) - hero_image_adj * 0.07
+            elif action == "check":
+                v = coeffs.check_noise + hero_image_adj * 0.06
+            elif action == "call":
+                v = coeffs.call_noise_post - pressure * 0.15 + hero_image_adj * coeffs.call_image_post
+            elif action == "raise":
+                v = coeffs.raise_noise_post
+            elif action == "fold":
+                v = 0.34 + pressure * 0.28 - coeffs.fold_wtsd_w - hero_image_adj * 0.16
+            else:
+                v = 0.0
+            out.append(0.01 + v)
         return _normalize_distribution(out)
 
     def _villain_action_distribution(
@@ -832,47 +1266,32 @@ class LiveMatch:
         call_amount: float,
         hero_checked: bool = False,
         is_raise: bool = False,
-    ) -> Dict[str, float]:
+    ) -> List[float]:
+        """Villain's action probabilities, positionally aligned with ``actions``."""
         hand = self.current_hand
-        if hand is None:
-            return {a: 1.0 / max(1, len(actions)) for a in actions}
-        actions = [a for a in actions if a]
-        if not actions:
-            return {}
-
-        combo_entry = self._range_index.get(_canonical_combo(hand.villain_hand))
-        if combo_entry is None:
-            combo_entry = {
-                "cards": _canonical_combo(hand.villain_hand),
-                "play_prob": _clamp(self.opponent.vpip, 0.05, 0.95),
-                "raise_prob": _clamp(self.opponent.pfr, 0.02, 0.85),
-                "call_prob": _clamp(self.opponent.vpip - self.opponent.pfr + 0.12, 0.02, 0.92),
-                "threebet_prob": _clamp(self.opponent.three_bet * 2.0, 0.01, 0.75),
-                "pre_score": preflop_strength_score(hand.villain_hand[0], hand.villain_hand[1]) / 100.0,
-                "strength_q": 0.5,
-                "weight": 1.0,
-            }
-
-        actual = {}
-        for action in actions:
-            actual[action] = self._combo_action_probability(
-                entry=combo_entry,
-                action=action,
-                call_amount=call_amount,
-                hero_checked=hero_checked,
-                is_raise=is_raise,
-            )
-        actual = _normalize_distribution(actual)
-        range_shares = self._range_action_shares(actions, call_amount=call_amount, hero_checked=hero_checked, is_raise=is_raise)
-        noise = self._style_noise_distribution(actions, call_amount=call_amount, hero_checked=hero_checked, is_raise=is_raise)
+        if hand is None or not actions:
+            return [1.0 / max(1, len(actions))] * len(actions)
+        ctx = self._precompute_decision_context(call_amount, hero_checked, is_raise)
+
+        actual_probs = self._range_action_probs(self._villain_row(), ctx, actions)
+        actual = _normalize_distribution([actual_probs[action][0] for action in actions])
+        range_shares = self._range_action_shares(actions, ctx)
+        noise = self._style_noise_distribution(actions, ctx)
 
         adherence = self._range_adherence_value
-        final = {}
-        for action in actions:
-            final[action] = adherence * (actual[action] * 0.64 + range_shares[action] * 0.36) + (1.0 - adherence) * noise[action]
+        stray = 1.0 - adherence
+        final = [
+            adherence * (a * 0.64 + r * 0.36) + stray * n
+            for a, r, n in zip(actual, range_shares, noise)
+        ]
         return _normalize_distribution(final)
 
-    def _cap_unrealistic_folds(self, distribution: Dict[str, float], call_amount: float) -> Dict[str, float]:
+    def _cap_unrealistic_folds(
+        self,
+        actions: List[str],
+        distribution: List[float],
+        call_amount: float,
+    ) -> List[float]:
         """
         Guardrail for fold/call decisions so very strong holdings do not fold too often.
 
@@ -884,8 +1303,10 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None:
             return distribution
-        if "fold" not in distribution or "call" not in distribution:
+        if "fold" not in actions or "call" not in actions:
             return distribution
+        fold_idx = actions.index("fold")
+        call_idx = actions.index("call")
 
         call_amount = max(0.0, float(call_amount))
         if call_amount <= 0:
@@ -895,7 +1316,7 @@ class LiveMatch:
         pressure = call_amount / pot
         max_fold: Optional[float] = None
 
-        if hand.street == "preflop":
+        if hand.street_id == _PREFLOP:
             r1 = card_rank(hand.villain_hand[0])
             r2 = card_rank(hand.villain_hand[1])
             hi = max(r1, r2)
@@ -929,26 +1350,30 @@ class LiveMatch:
         if max_fold is None:
             return distribution
 
-        fold_p = float(distribution.get("fold", 0.0))
+        fold_p = distribution[fold_idx]
         if fold_p <= max_fold + 1e-9:
             return distribution
 
-        adjusted = dict(distribution)
+        adjusted = list(distribution)
         overflow = fold_p - max_fold
-        adjusted["fold"] = max_fold
-        adjusted["call"] = float(adjusted.get("call", 0.0)) + overflow
+        adjusted[fold_idx] = max_fold
+        adjusted[call_idx] += overflow
         return _normalize_distribution(adjusted)
 
-    def _sample_action(self, distribution: Dict[str, float]) -> str:
+    def _sample_action(self, actions: List[str], distribution: List[float]) -> str:
+        if not actions:
+            return ""
+        # Inverse-CDF draw: first action whose running total reaches r. The
+        # running sum adds in the same order as a cumulative list would, so the
+        # pick is unchanged without allocating one per decision.
         r = self.rng.random()
-        cumulative = 0.0
-        last = ""
-        for action, prob in distribution.items():
-            last = action
-            cumulative += prob
-            if r <= cumulative:
+        total = 0.0
+        for action, p in zip(actions, distribution):
+            total += p
+            if total >= r:
                 return action
-        return last
+        # Float rounding can leave the total just under r.
+        return actions[-1]
 
     def _update_range_after_action(
         self,
@@ -957,98 +1382,99 @@ class LiveMatch:
         hero_checked: bool,
         is_raise: bool,
     ) -> None:
-        if not self._range_entries:
+        table = self._range
+        if table is None:
             return
-        adherence = self._range_adherence_value
-        for entry in self._range_entries:
-            like = self._combo_action_probability(
-                entry=entry,
-                action=action,
-                call_amount=call_amount,
-                hero_checked=hero_checked,
-                is_raise=is_raise,
-            )
-            floor = 0.01 + (1.0 - adherence) * 0.10
-            entry["weight"] = max(1e-9, entry["weight"] * max(floor, like))
+        ctx = self._precompute_decision_context(call_amount, hero_checked, is_raise)
+        if ctx is None:
+            return
+        likes = self._range_action_probs(table, ctx, [action])[action]
+        floor = 0.01 + (1.0 - self._range_adherence_value) * 0.10
+        weights = [max(1e-9, w * max(floor, like)) for w, like in zip(table.weight, likes)]
 
-        total = sum(e["weight"] for e in self._range_entries)
+        total = sum(weights)
         if total > 0:
-            for entry in self._range_entries:
-                entry["weight"] /= total
+            weights = [w / total for w in weights]
+        table.weight = weights
         self._refresh_range_summary(event=f"{self.current_hand.street}_{action}" if self.current_hand else action)
 
     def _refresh_range_summary(self, event: str) -> None:
+        """Mark the range summary stale; it is rebuilt on the next state() read.
+
+        Only the inputs that can change before that read are captured. The weights
+        list is replaced, never mutated, on each range update.
+        """
         hand = self.current_hand
         if hand is None:
             return
-        if not self._range_entries:
+        table = self._range
+        if table is None:
+            self._range_summary_pending = None
             hand.villain_range_summary = {}
             return
+        self._range_summary_pending = (event, table, table.weight, hand.street, hand.board, self._hero_image_value)
 
-        sorted_entries = sorted(self._range_entries, key=lambda e: e["weight"], reverse=True)
-        top_keys: List[str] = []
-        seen = set()
-        for e in sorted_entries:
-            key = e["key"]
-            if key in seen:
-                continue
-            top_keys.append(key)
-            seen.add(key)
-            if len(top_keys) >= 12:
-                break
+    def _flush_range_summary(self) -> None:
+        pending = self._range_summary_pending
+        hand = self.current_hand
+        if pending is None or hand is None:
+            return
+        self._range_summary_pending = None
+        event, table, weights, street, board, hero_image = pending
+
+        top_keys = _top_distinct_keys(weights, table.keys, 12)
 
         width_threshold = 0.00065
-        width_pct = sum(1 for e in self._range_entries if e["weight"] >= width_threshold) / len(self._range_entries)
+        width_pct = sum(map(width_threshold.__le__, weights)) / len(weights)
         value_density = 0.0
         bluff_density = 0.0
-        for e in self._range_entries:
-            strength = self._combo_postflop_strength(e["cards"], hand.board, hand.street)
-            draw = self._combo_draw_strength(e["cards"], hand.board)
+        strengths, draws = self._range_strength_features(table, board, street)
+        for w, strength, draw in zip(weights, strengths, draws):
             if strength >= 0.74:
-                value_density += e["weight"]
+                value_density += w
             if strength < 0.50 and draw <= 0.18:
-                bluff_density += e["weight"]
+                bluff_density += w
 
         actual_key = _combo_key(hand.villain_hand)
-        actual_entry = self._range_index.get(_canonical_combo(hand.villain_hand))
+        actual_idx = hand.villain_range_idx
         hand.villain_range_summary = {
             "event": event,
-            "street": hand.street,
+            "street": street,
             "adherence": round(self._range_adherence_value, 3),
-            "hero_image_score": round(self._hero_image_score(), 3),
+            "hero_image_score": round(hero_image, 3),
             "range_width_pct": round(width_pct, 3),
             "value_density_pct": round(value_density, 3),
             "bluff_density_pct": round(bluff_density, 3),
             "top_weighted_hands": top_keys,
             "actual_villain_hand_key": actual_key,
-            "actual_hand_weight": round(actual_entry["weight"], 5) if actual_entry else 0.0,
+            "actual_hand_weight": round(weights[actual_idx], 5) if actual_idx is not None else 0.0,
         }
 
     def _hero_commit(self, amount: float) -> float:
         hand = self.current_hand
         if hand is None:
             return 0.0
-        amt = _round1(min(max(0.0, amount), hand.hero_remaining_bb))
-        hand.hero_remaining_bb = _round1(hand.hero_remaining_bb - amt)
-        hand.hero_invested_bb = _round1(hand.hero_invested_bb + amt)
-        hand.pot_bb = _round1(hand.pot_bb + amt)
-        return amt
+        amt = min(_to_dbb(amount), hand.hero_remaining_dbb)
+        hand.hero_remaining_dbb -= amt
+        hand.hero_invested_dbb += amt
+        hand.pot_dbb += amt
+        return amt / 10.0
 
     def _villain_commit(self, amount: float) -> float:
         hand = self.current_hand
         if hand is None:
             return 0.0
-        amt = _round1(min(max(0.0, amount), hand.villain_remaining_bb))
-        hand.villain_remaining_bb = _round1(hand.villain_remaining_bb - amt)
-        hand.villain_invested_bb = _round1(hand.villain_invested_bb + amt)
-        hand.pot_bb = _round1(hand.pot_bb + amt)
-        return amt
+        amt = min(_to_dbb(amount), hand.villain_remaining_dbb)
+        hand.villain_remaining_dbb -= amt
+        hand.villain_invested_dbb += amt
+        hand.pot_dbb += amt
+        return amt / 10.0
 
     def _set_preflop_aggressor(self, who: str) -> None:
         hand = self.current_hand
         if hand is None:
             return
-        if hand.street == "preflop":
+        if hand.street_id == _PREFLOP:
             hand.preflop_aggressor = who
 
     def _villain_preflop_first_action(self) -> None:
@@ -1061,13 +1487,14 @@ class LiveMatch:
             hand.action_context = "checked_to_hero"
             return
 
+        actions = ["fold", "call", "raise"]
         distribution = self._villain_action_distribution(
-            actions=["fold", "call", "raise"],
+            actions=actions,
             call_amount=to_call_prev,
             hero_checked=False,
             is_raise=False,
         )
-        selected = self._sample_action(distribution)
+        selected = self._sample_action(actions, distribution)
 
         if selected == "fold":
             hand.action_history.append("Villain folds from SB.")
@@ -1076,14 +1503,12 @@ class LiveMatch:
             return
 
         if selected == "raise":
-            actual_entry = self._range_index.get(_canonical_combo(hand.villain_hand))
-            strength_q = actual_entry["strength_q"] if actual_entry else 0.50
-            base = self.rng.uniform(3.1, 5.7) + strength_q * 0.8
-            base += max(0.0, self.opponent.af - 2.8) * 0.15
-            base -= self.opponent.limp_rate * 0.35
+            base = self.rng.uniform(3.1, 5.7) + hand.villain_strength_q * 0.8
+            base += self._coeffs.open_raise_af_w
+            base -= self._coeffs.open_raise_limp_w
             raise_amount = _round1(_clamp(base, to_call_prev + 1.2, hand.villain_remaining_bb))
             commit = self._villain_commit(raise_amount)
-            hand.action_history.append(f"Villain raises {commit:.1f}bb from SB.")
+            hand.action_history.append(("villain_raises_sb", commit))
             hand.to_call_bb = _round1(max(0.0, commit - to_call_prev))
             hand.action_context = "facing_bet"
             hand.preflop_aggressor = "villain"
@@ -1091,7 +1516,7 @@ class LiveMatch:
         else:
             call_amt = _round1(min(to_call_prev, hand.villain_remaining_bb))
             commit = self._villain_commit(call_amt)
-            hand.action_history.append(f"Villain limps/calls {commit:.1f}bb.")
+            hand.action_history.append(("villain_limps", commit))
             hand.to_call_bb = 0.0
             hand.action_context = "checked_to_hero"
             self._update_range_after_action(action="call", call_amount=to_call_prev, hero_checked=False, is_raise=False)
@@ -1100,13 +1525,14 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None or hand.hand_over:
             return
+        actions = ["check", "bet"]
         distribution = self._villain_action_distribution(
-            actions=["check", "bet"],
+            actions=actions,
             call_amount=0.0,
             hero_checked=False,
             is_raise=False,
         )
-        selected = self._sample_action(distribution)
+        selected = self._sample_action(actions, distribution)
         if hand.villain_remaining_bb <= 0 or selected == "check":
             hand.action_history.append("Villain checks.")
             hand.to_call_bb = 0.0
@@ -1117,7 +1543,7 @@ class LiveMatch:
 
         size = self._villain_bet_size()
         commit = self._villain_commit(size)
-        hand.action_history.append(f"Villain bets {commit:.1f}bb.")
+        hand.action_history.append(("villain_bets", commit))
         hand.to_call_bb = commit
         hand.action_context = "facing_bet"
         hand.hero_phase = "initial"
@@ -1127,13 +1553,14 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None or hand.hand_over:
             return
+        actions = ["check", "bet"]
         distribution = self._villain_action_distribution(
-            actions=["check", "bet"],
+            actions=actions,
             call_amount=0.0,
             hero_checked=True,
             is_raise=False,
         )
-        selected = self._sample_action(distribution)
+        selected = self._sample_action(actions, distribution)
         if hand.villain_remaining_bb <= 0 or selected == "check":
             hand.action_history.append("Villain checks behind.")
             self._update_range_after_action(action="check", call_amount=0.0, hero_checked=True, is_raise=False)
@@ -1142,7 +1569,7 @@ class LiveMatch:
 
         size = self._villain_bet_size()
         commit = self._villain_commit(size)
-        hand.action_history.append(f"Villain bets {commit:.1f}bb after check.")
+        hand.action_history.append(("villain_bets_after_check", commit))
         hand.to_call_bb = commit
         hand.action_context = "facing_bet"
         hand.hero_phase = "response"
@@ -1163,14 +1590,15 @@ class LiveMatch:
             self._advance_street()
             return
 
+        actions = ["fold", "call"]
         distribution = self._villain_action_distribution(
-            actions=["fold", "call"],
+            actions=actions,
             call_amount=call_amount,
             hero_checked=False,
             is_raise=is_raise,
         )
-        distribution = self._cap_unrealistic_folds(distribution, call_amount=call_amount)
-        selected = self._sample_action(distribution)
+        distribution = self._cap_unrealistic_folds(actions, distribution, call_amount=call_amount)
+        selected = self._sample_action(actions, distribution)
         if selected == "fold":
             hand.action_history.append("Villain folds.")
             self._update_range_after_action(action="fold", call_amount=call_amount, hero_checked=False, is_raise=is_raise)
@@ -1178,7 +1606,7 @@ class LiveMatch:
             return
 
         commit = self._villain_commit(call_amount)
-        hand.action_history.append(f"Villain calls {commit:.1f}bb.")
+        hand.action_history.append(("villain_calls", commit))
         self._update_range_after_action(action="call", call_amount=call_amount, hero_checked=False, is_raise=is_raise)
         hand.to_call_bb = 0.0
         if self._is_all_in():
@@ -1190,21 +1618,18 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None:
             return 0.3
-        street = hand.street
-        texture = board_texture_score(hand.board)
-        if street == "flop":
-            base = self.opponent.flop_cbet if hand.preflop_aggressor == "villain" else 0.20 + self.opponent.aggression_frequency * 0.40
-        elif street == "turn":
-            base = self.opponent.turn_cbet if hand.preflop_aggressor == "villain" else 0.16 + self.opponent.aggression_frequency * 0.34
-        elif street == "river":
-            base = self.opponent.river_cbet if hand.preflop_aggressor == "villain" else 0.12 + self.opponent.aggression_frequency * 0.28
+        coeffs = self._coeffs
+        street_id = hand.street_id
+        texture = hand.board_texture
+        if street_id != _PREFLOP and hand.preflop_aggressor == "villain":
+            base = coeffs.cbet_by_street[street_id]
         else:
-            base = 0.26 + self.opponent.pfr * 0.25
+            base = coeffs.lead_bet_by_street[street_id]
 
         if hero_checked:
             base += 0.12
-        base += max(0.0, self.opponent.af - 2.0) * 0.04
-        base -= texture * 0.03 if street in {"turn", "river"} else 0.0
+        base += coeffs.af_bet_bonus
+        base -= texture * 0.03 if street_id >= _TURN else 0.0
         return _clamp(base, 0.05, 0.92)
 
     def _villain_bet_size(self) -> float:
@@ -1212,15 +1637,11 @@ class LiveMatch:
         if hand is None:
             return 2.0
         pot = max(1.0, hand.pot_bb)
-        texture = board_texture_score(hand.board)
-        entry = self._range_index.get(_canonical_combo(hand.villain_hand))
-        combo_strength = self._combo_postflop_strength(
-            _canonical_combo(hand.villain_hand),
-            hand.board,
-            hand.street,
-        )
-        if hand.street == "preflop":
-            combo_strength = entry["strength_q"] if entry else combo_strength
+        texture = hand.board_texture
+        if hand.street_id == _PREFLOP and hand.villain_range_idx is not None:
+            combo_strength = hand.villain_strength_q
+        else:
+            combo_strength = _combo_postflop_strength(hand.villain_combo, hand.board, hand.street)
 
         if self.opponent.af < 1.2:
             size_ratio = self.rng.uniform(0.38, 0.78)
@@ -1231,7 +1652,7 @@ class LiveMatch:
 
         size_ratio += max(0.0, combo_strength - 0.52) * 0.28
         size_ratio += 0.10 if texture > 1.4 else 0.0
-        if self.opponent.style_label.lower().find("calling station") >= 0:
+        if self._coeffs.is_calling_station:
             size_ratio += 0.05
         raw = pot * _clamp(size_ratio, 0.25, 1.35)
         return _round1(_clamp(raw, 1.0, hand.villain_remaining_bb))
@@ -1240,7 +1661,7 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None:
             return 0.4
-        if hand.street == "preflop":
+        if hand.street_id == _PREFLOP:
             return _clamp(preflop_strength_score(hand.villain_hand[0], hand.villain_hand[1]) / 100.0, 0.0, 1.0)
 
         board = hand.board
@@ -1251,7 +1672,7 @@ class LiveMatch:
             kicker = rank[1][0] / 14.0
         draw_bonus = 0.0
         if len(board) < 5:
-            texture = board_texture_score(board)
+            texture = hand.board_texture
             broadway_cards = sum(1 for c in hand.villain_hand if c[0] in "TJQKA")
             draw_bonus = broadway_cards * 0.04 + texture * 0.03
         return _clamp(category * 0.78 + kicker * 0.14 + draw_bonus, 0.0, 1.2)
@@ -1263,17 +1684,12 @@ class LiveMatch:
         pot = max(1.0, hand.pot_bb)
         pot_odds = call_amount / (pot + call_amount)
         strength = self._villain_strength()
-        vpip_pfr_gap = max(0.0, self.opponent.vpip - self.opponent.pfr)
-        sticky = _clamp(
-            0.22 + self.opponent.wtsd * 0.45 + vpip_pfr_gap * 0.68 - self.opponent.af * 0.05,
-            0.05,
-            0.96,
-        )
+        sticky = self._coeffs.sticky
         pressure = call_amount / pot
         fold = 0.48 + pressure * 0.24 + pot_odds * 0.25 - strength * 0.52 - sticky * 0.34
-        if is_raise and hand.street == "preflop":
-            fold += self.opponent.fold_to_3bet * 0.42
-        if self.opponent.style_label.lower().find("calling") >= 0:
+        if is_raise and hand.street_id == _PREFLOP:
+            fold += self._coeffs.fold_to_3bet_w
+        if self._coeffs.is_calling:
             fold -= 0.10
         return _clamp(fold, 0.02, 0.92)
 
@@ -1281,7 +1697,7 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None:
             return False
-        return hand.hero_remaining_bb <= 0.01 or hand.villain_remaining_bb <= 0.01
+        return hand.hero_remaining_dbb <= 0 or hand.villain_remaining_dbb <= 0
 
     def _advance_street(self) -> None:
         hand = self.current_hand
@@ -1293,12 +1709,13 @@ class LiveMatch:
             return
 
         hand.street = nxt
-        hand.board = hand.full_board[: _street_board_count(nxt)]
+        hand.street_id = _STREET_ID[nxt]
+        hand.set_board(hand.full_board[: _street_board_count(nxt)])
         hand.to_call_bb = 0.0
         hand.action_context = "checked_to_hero"
         hand.hero_phase = "initial"
         hand.hero_first_this_street = self._hero_first_on_street(nxt, hand.button_on_hero)
-        hand.action_history.append(f"--- {nxt.upper()} ---")
+        hand.action_history.append(("street", nxt.upper()))
         self._refresh_range_summary(event=f"enter_{nxt}")
 
         if hand.hero_first_this_street:
@@ -1313,7 +1730,7 @@ class LiveMatch:
         hand = self.current_hand
         if hand is None or hand.hand_over:
             return
-        hand.board = hand.full_board[:5]
+        hand.set_board(hand.full_board[:5])
         self._refresh_range_summary(event="showdown")
         hero_rank = best_hand_rank(hand.hero_hand + hand.board)
         villain_rank = best_hand_rank(hand.villain_hand + hand.board)
@@ -1345,7 +1762,7 @@ class LiveMatch:
             "hero_delta_bb": round(hero_delta, 3),
             "board": list(hand.board),
         }
-        hand.action_history.append(f"Showdown: {winner}. Hero delta {hero_delta:.2f}bb.")
+        hand.action_history.append(("showdown", winner, hero_delta))
 
     def _end_by_fold(self, winner: str, reason: str) -> None:
         hand = self.current_hand
@@ -1369,7 +1786,7 @@ class LiveMatch:
             "hero_delta_bb": round(hero_delta, 3),
             "board": list(hand.board),
         }
-        hand.action_history.append(f"Hand ends: {reason}")
+        hand.action_history.append(("hand_ends", reason))
 
     def _update_legal_options(self) -> None:
         hand = self.current_hand
@@ -1398,18 +1815,19 @@ class LiveMatch:
     def _bet_size_options(self, effective: float, pot: float) -> List[float]:
         if effective <= 0.05:
             return []
-        base = [pot * p for p in BET_SIZE_PCTS] + [pot]
-        options = sorted({_round1(_clamp(v, 1.0, effective)) for v in base if v > 0})
+        # Ascending pot fractions, a monotone clamp/quantize to deci-bb and the all-in
+        # size last keep the candidates sorted, so no set/sort pass is needed.
+        effective_dbb = _to_dbb(effective)
+        candidates = [_to_dbb(_clamp(pot * p, 1.0, effective)) for p in _BET_OPTION_PCTS if pot * p > 0]
         if effective >= 1.0:
-            options.append(_round1(effective))
-        options = sorted(set(v for v in options if 0.8 <= v <= effective + 1e-9))
-        return options[:6]
+            candidates.append(effective_dbb)
+        return _size_options_from_ascending(candidates, 8, effective_dbb)
 
     def _raise_size_options(self, to_call: float, effective: float, pot: float) -> List[float]:
         if effective <= to_call + 0.05:
             return []
         min_raise = max(to_call * 2.0, to_call + 1.0)
         base = [min_raise, to_call + pot * 0.5, to_call + pot * 0.75, to_call + pot * 1.25, effective]
-        options = sorted({_round1(_clamp(v, min_raise, effective)) for v in base if v > to_call})
-        options = [v for v in options if v > to_call + 0.1 and v <= effective + 1e-9]
-        return options[:6]
+        # Clamping into [min_raise, effective] keeps this ascending list non-decreasing.
+        candidates = [_to_dbb(_clamp(v, min_raise, effective)) for v in base if v > to_call]
+        return _size_options_from_ascending(candidates, _to_dbb(to_call) + 2, _to_dbb(effective))
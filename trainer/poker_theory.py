@@ -10,10 +10,6 @@ from dataclasses import dataclass
 from typing import Dict, List
 
 
-def _clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
-
-
 def required_equity_to_call(pot_before_call: float, call_amount: float) -> float:
     """
     Break-even equity for a call.
@@ -37,7 +33,7 @@ def minimum_defense_frequency(pot_before_bet: float, bet_size: float) -> float:
     bet = max(0.0, float(bet_size))
     if bet <= 0:
         return 1.0
-    return _clamp(pot / max(1e-9, pot + bet), 0.0, 1.0)
+    return min(1.0, max(0.0, pot / max(1e-9, pot + bet)))
 
 
 def break_even_bluff_fold_frequency(risk: float, reward: float) -> float:
@@ -50,7 +46,7 @@ def break_even_bluff_fold_frequency(risk: float, reward: float) -> float:
     w = max(0.0, float(reward))
     if r <= 0:
         return 0.0
-    return _clamp(r / max(1e-9, r + w), 0.0, 1.0)
+    return min(1.0, max(0.0, r / max(1e-9, r + w)))
 
 
 def polarized_bluff_share(bet_to_pot_ratio: float) -> float:
@@ -62,7 +58,7 @@ def polarized_bluff_share(bet_to_pot_ratio: float) -> float:
     b = max(0.0, float(bet_to_pot_ratio))
     if b <= 0:
         return 0.0
-    return _clamp(b / (1.0 + b), 0.0, 1.0)
+    return min(1.0, max(0.0, b / (1.0 + b)))
 
 
 def bluff_to_value_ratio(bet_to_pot_ratio: float) -> float:
@@ -123,11 +119,13 @@ def classify_spr(spr: float) -> SprBand:
     )
 
 
+# The MDF reference depends only on fixed bet sizes, so it is computed once at import.
+_COMMON_MDF_ROWS = tuple(
+    (b, round(minimum_defense_frequency(1.0, b), 4))
+    for b in (0.25, 0.33, 0.5, 0.66, 0.75, 1.0, 1.5)
+)
+
+
 def common_mdf_reference() -> List[Dict[str, float]]:
     """Quick MDF table for common bet sizes."""
-    bet_sizes = [0.25, 0.33, 0.5, 0.66, 0.75, 1.0, 1.5]
-    out: List[Dict[str, float]] = []
-    for b in bet_sizes:
-        mdf = minimum_defense_frequency(1.0, b)
-        out.append({"bet_to_pot": b, "mdf": round(mdf, 4)})
-    return out
+    return [{"bet_to_pot": b, "mdf": mdf} for b, mdf in _COMMON_MDF_ROWS]
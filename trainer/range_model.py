@@ -4,25 +4,20 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Sequence
+from functools import lru_cache
+from typing import Callable, Sequence
 
-from trainer.archetypes import Archetype
-from trainer.cards import best_hand_rank, preflop_strength_score
+from trainer.archetypes import ARCHETYPES, Archetype
+from trainer.cards import CARD_INDEX, PREFLOP_STRENGTH_TABLE, board_ranker
 
 
-def _clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+# Upper bounds of the two quality terms, used to scale the rejection envelope.
+_PRE_STRENGTH_MAX = max(PREFLOP_STRENGTH_TABLE)
+_MADE_HAND_SCORE_MAX = 1.0 + 0.3
 
 
-def _sigmoid(x: float) -> float:
-    return 1.0 / (1.0 + math.exp(-x))
-
-
-def _made_hand_score(hole: Sequence[str], board: Sequence[str]) -> float:
-    """Normalize current made-hand category to roughly [0, 1.3]."""
-    if len(board) < 3:
-        return 0.0
-    rank = best_hand_rank(list(hole) + list(board))
+def _rank_score(rank: tuple) -> float:
+    """Normalize a made-hand rank to roughly [0, 1.3]."""
     category = rank[0] / 8.0
     kicker = 0.0
     if rank[1]:
@@ -30,6 +25,12 @@ def _made_hand_score(hole: Sequence[str], board: Sequence[str]) -> float:
     return category + 0.3 * kicker
 
 
+@lru_cache(maxsize=64)
+def _board_ranker(board: tuple[str, ...]) -> Callable[[str, str], tuple]:
+    """Board-side evaluator state, shared by every candidate drawn on that board."""
+    return board_ranker(board)
+
+
 def sample_villain_hand(
     deck: Sequence[str],
     board: Sequence[str],
@@ -43,6 +44,8 @@ def sample_villain_hand(
     Sample a villain hand with rejection-sampling to mimic role/archetype ranges.
 
     pressure: 0.0 to 1.0, where higher means villain should continue tighter.
+    deck is indexed in place (never copied); the two cards returned are always
+    distinct positions of it.
     """
     if len(deck) < 2:
         raise ValueError("Not enough cards in deck")
@@ -54,22 +57,63 @@ def sample_villain_hand(
         "unknown": 0.0,
     }.get(role, 0.0)
 
+    postflop = street != "preflop" and len(board) >= 3
+    target = archetype.preflop_tightness + role_tightness + pressure * 0.30
+    target -= (archetype.bluff_factor - 0.4) * 0.15
+    # Scale acceptance by the best quality any hand could reach so tight
+    # targets don't burn the whole loop; the accepted range is unchanged.
+    post_bound = 0.4 * _MADE_HAND_SCORE_MAX if postflop else 0.0
+    quality_max = 0.6 * _PRE_STRENGTH_MAX + post_bound
+    envelope = 1.0 / (1.0 + math.exp(-(quality_max - target) * 7.0))
+
+    rank_hole = _board_ranker(tuple(board)) if postflop else None
+
+    card_index = CARD_INDEX
+    pre_strength = PREFLOP_STRENGTH_TABLE
+    randrange = rng.randrange
+    random_ = rng.random
+    log = math.log
+    n = len(deck)
     for _ in range(120):
-        hand = tuple(rng.sample(list(deck), 2))
-        pre = preflop_strength_score(hand[0], hand[1]) / 100.0
-
-        post = 0.0
-        if street != "preflop" and len(board) >= 3:
-            post = _made_hand_score(hand, board)
-
-        quality = 0.6 * pre + 0.4 * post
-        target = archetype.preflop_tightness + role_tightness + pressure * 0.30
-        target -= (archetype.bluff_factor - 0.4) * 0.15
-        accept_prob = _sigmoid((quality - target) * 7.0)
-        if rng.random() < accept_prob:
-            return hand
-
-    return tuple(rng.sample(list(deck), 2))
+        # Two distinct indices without copying the deck: draw the second from
+        # the n - 1 remaining slots and step over the first.
+        i = randrange(n)
+        j = randrange(n - 1)
+        if j >= i:
+            j += 1
+        card_a = deck[i]
+        card_b = deck[j]
+        quality = 0.6 * pre_strength[card_index[card_a] * 52 + card_index[card_b]]
+
+        # Invert the sigmoid once per draw: the candidate is accepted when its
+        # quality clears this threshold, so hands whose preflop part cannot
+        # reach it are rejected before the made-hand evaluation.
+        u = random_() * envelope
+        if u <= 0.0:
+            return card_a, card_b
+        threshold = target + log(u / (1.0 - u)) / 7.0
+        if postflop:
+            if quality + post_bound <= threshold:
+                continue
+            quality += 0.4 * _rank_score(rank_hole(card_a, card_b))
+        if quality > threshold:
+            return card_a, card_b
+
+    i = randrange(n)
+    j = randrange(n - 1)
+    if j >= i:
+        j += 1
+    return deck[i], deck[j]
+
+
+# Fold-to-bet field per street; preflop (and anything unknown) uses fold_to_raise.
+_BET_FOLD_FIELD = {
+    "flop": "fold_to_flop_bet",
+    "turn": "fold_to_turn_bet",
+    "river": "fold_to_river_bet",
+}
+_SIZE_PENALTY_MULT = {"river": 1.25}
+_ROLE_CONTINUE_ADJ = {"bettor": 0.08, "caller": 0.05, "waiting": -0.03, "unknown": 0.0}
 
 
 def continue_probability(
@@ -82,25 +126,38 @@ def continue_probability(
     """Estimate villain continue frequency versus hero bet/raise."""
     if action_kind not in {"bet", "raise"}:
         raise ValueError("action_kind must be bet or raise")
+    if ARCHETYPES.get(archetype.key) is archetype:
+        # Registry archetypes are interned, so their key stands in for the object.
+        return _registered_continue_probability(archetype.key, street, action_kind, size_pot_ratio, role)
+    return _continue_probability(archetype, street, action_kind, size_pot_ratio, role)
+
+
+@lru_cache(maxsize=4096)
+def _registered_continue_probability(
+    archetype_key: str,
+    street: str,
+    action_kind: str,
+    size_pot_ratio: float,
+    role: str,
+) -> float:
+    return _continue_probability(ARCHETYPES[archetype_key], street, action_kind, size_pot_ratio, role)
+
 
+def _continue_probability(
+    archetype: Archetype,
+    street: str,
+    action_kind: str,
+    size_pot_ratio: float,
+    role: str,
+) -> float:
     if action_kind == "raise":
         base = archetype.continue_vs_raise
     else:
-        if street == "flop":
-            base = 1.0 - archetype.fold_to_flop_bet
-        elif street == "turn":
-            base = 1.0 - archetype.fold_to_turn_bet
-        elif street == "river":
-            base = 1.0 - archetype.fold_to_river_bet
-        else:
-            base = 1.0 - archetype.fold_to_raise
-
-    size_penalty = max(0.0, size_pot_ratio - 0.5) * 0.20
-    role_adj = {"bettor": 0.08, "caller": 0.05, "waiting": -0.03, "unknown": 0.0}.get(role, 0.0)
-    aggression_adj = (archetype.aggression - 0.5) * 0.14
-
-    if street == "river":
-        size_penalty *= 1.25
+        base = 1.0 - getattr(archetype, _BET_FOLD_FIELD.get(street, "fold_to_raise"))
 
-    return _clamp(base - size_penalty + role_adj + aggression_adj, 0.05, 0.95)
+    size_penalty = max(0.0, size_pot_ratio - 0.5) * 0.20 * _SIZE_PENALTY_MULT.get(street, 1.0)
+    role_adj = _ROLE_CONTINUE_ADJ.get(role, 0.0)
+    aggression_adj = (archetype.aggression - 0.5) * 0.14
 
+    value = base - size_penalty + role_adj + aggression_adj
+    return 0.05 if value < 0.05 else 0.95 if value > 0.95 else value
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import random
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
-from trainer.archetypes import ARCHETYPES, archetype_by_key
+from trainer.archetypes import ARCHETYPES
 from trainer.cards import full_deck
 from trainer.constants import (
     ACTION_CONTEXTS,
@@ -17,13 +18,14 @@ from trainer.constants import (
     DEFAULT_SB,
     DEFAULT_STACK_BB,
     NODE_TYPES,
+    POSITION_SETS,
     STREETS,
     positions_for_table,
 )
 from trainer.hero_profile import parse_hero_profile, randomize_hero_profile
 
 
-@dataclass
+@dataclass(slots=True)
 class SeatState:
     """One seat state in a generated scenario."""
 
@@ -49,8 +51,42 @@ class SeatState:
         }
 
 
-def _clamp(value: float, low: float, high: float) -> float:
-    return max(low, min(high, value))
+_FULL_DECK = tuple(full_deck())
+_BET_PCTS_ASCENDING = tuple(sorted(set(BET_SIZE_PCTS)))
+_ARCHETYPE_LABELS = {key: archetype.label for key, archetype in ARCHETYPES.items()}
+
+_BLIND_ARCHETYPE_POOL = ("calling_station", "weak_tight", "tag_reg", "overcaller_preflop", "lag_reg")
+_EARLY_ARCHETYPE_POOL = ("tag_reg", "nit", "weak_tight", "trappy")
+_LATE_ARCHETYPE_POOL = ("tag_reg", "lag_reg", "one_and_done", "fit_or_fold", "calling_station")
+_ARCHETYPE_POOL_BY_POSITION = {
+    "SB": _BLIND_ARCHETYPE_POOL,
+    "BB": _BLIND_ARCHETYPE_POOL,
+    "UTG": _EARLY_ARCHETYPE_POOL,
+    "LJ": _EARLY_ARCHETYPE_POOL,
+}
+
+
+# (unix second, ISO text up to that second); swapped as one tuple so threads never
+# pair a new second with a stale prefix.
+_ISO_SECOND: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """``datetime.now(timezone.utc).isoformat()``, formatting the date part once per second."""
+    global _ISO_SECOND
+    now = time.time()
+    second = int(now)
+    micro = round((now - second) * 1e6)
+    if micro >= 1_000_000:
+        second += 1
+        micro -= 1_000_000
+    cached_second, prefix = _ISO_SECOND
+    if cached_second != second:
+        prefix = datetime.fromtimestamp(second, timezone.utc).isoformat()[:-6]
+        _ISO_SECOND = (second, prefix)
+    if micro:
+        return f"{prefix}.{micro:06d}+00:00"
+    return f"{prefix}+00:00"
 
 
 def _street_board_count(street: str) -> int:
@@ -65,31 +101,33 @@ def _node_preflop_pot(node_type: str) -> float:
     return 33.0
 
 
+# Per-street pot growth as (low, high - low), applied in order like rng.uniform(low, high).
+_FLOP_GROWTH = (1.1, 1.45 - 1.1)
+_TURN_GROWTH = (1.2, 1.6 - 1.2)
+_RIVER_GROWTH = (1.15, 1.55 - 1.15)
+_POT_GROWTH_BY_STREET = {
+    "flop": (_FLOP_GROWTH,),
+    "turn": (_FLOP_GROWTH, _TURN_GROWTH),
+    "river": (_FLOP_GROWTH, _TURN_GROWTH, _RIVER_GROWTH),
+}
+
+
 def _pot_for_spot(node_type: str, street: str, players_in_hand: int, rng: random.Random) -> float:
     base = _node_preflop_pot(node_type)
     if street == "preflop":
         return base
 
     pot = base
-    if street in {"flop", "turn", "river"}:
-        pot *= rng.uniform(1.1, 1.45)
-    if street in {"turn", "river"}:
-        pot *= rng.uniform(1.2, 1.6)
-    if street == "river":
-        pot *= rng.uniform(1.15, 1.55)
+    random_ = rng.random
+    for low, span in _POT_GROWTH_BY_STREET[street]:
+        pot *= low + span * random_()
     pot *= 1.0 + max(0, players_in_hand - 2) * 0.16
     return round(max(5.0, pot), 2)
 
 
 def _default_archetype_for_position(position: str, rng: random.Random) -> str:
     """Weighted default so generated pools look realistic."""
-    if position in {"SB", "BB"}:
-        pool = ["calling_station", "weak_tight", "tag_reg", "overcaller_preflop", "lag_reg"]
-    elif position in {"UTG", "LJ"}:
-        pool = ["tag_reg", "nit", "weak_tight", "trappy"]
-    else:
-        pool = ["tag_reg", "lag_reg", "one_and_done", "fit_or_fold", "calling_station"]
-    return rng.choice(pool)
+    return rng.choice(_ARCHETYPE_POOL_BY_POSITION.get(position, _LATE_ARCHETYPE_POOL))
 
 
 def _preflop_order(positions: List[str]) -> List[str]:
@@ -120,11 +158,19 @@ def _active_acting_order(
     active_positions: List[str],
     street: str,
 ) -> List[str]:
-    if street == "preflop":
-        base = _preflop_order(table_positions)
-    else:
-        base = _postflop_order(table_positions)
-    return [p for p in base if p in active_positions]
+    orders = _ACTING_ORDERS.get(tuple(table_positions))
+    if orders is None:
+        orders = (_preflop_order(table_positions), _postflop_order(table_positions))
+    base = orders[0] if street == "preflop" else orders[1]
+    active = set(active_positions)
+    return [p for p in base if p in active]
+
+
+# (preflop, postflop) acting order for every table layout, keyed by its positions.
+_ACTING_ORDERS = {
+    tuple(positions): (tuple(_preflop_order(positions)), tuple(_postflop_order(positions)))
+    for positions in POSITION_SETS.values()
+}
 
 
 def _ordered_roles_for_hero_to_act(
@@ -180,16 +226,16 @@ def _apply_in_hand_target(
     hero_idx = next(i for i, seat in enumerate(seats) if seat.position == hero_position)
     seats[hero_idx].in_hand = True
 
-    currently = [s for s in seats if s.in_hand]
-    if len(currently) > players_in_hand:
-        removable = [s for s in currently if not s.is_hero]
-        rng.shuffle(removable)
-        for seat in removable[: len(currently) - players_in_hand]:
+    # rng.sample on these small pools is a partial Fisher-Yates: it draws only
+    # as many indices as seats that change, unlike a full shuffle.
+    currently = sum(1 for s in seats if s.in_hand)
+    if currently > players_in_hand:
+        removable = [s for s in seats if s.in_hand and not s.is_hero]
+        for seat in rng.sample(removable, min(len(removable), currently - players_in_hand)):
             seat.in_hand = False
-    elif len(currently) < players_in_hand:
+    elif currently < players_in_hand:
         available = [s for s in seats if not s.in_hand and not s.is_hero]
-        rng.shuffle(available)
-        for seat in available[: players_in_hand - len(currently)]:
+        for seat in rng.sample(available, min(len(available), players_in_hand - currently)):
             seat.in_hand = True
 
 
@@ -239,15 +285,19 @@ def _build_action_history(
     return history
 
 
-def _round_options(options: List[float], min_value: float, max_value: float) -> List[float]:
-    out = sorted(
-        {
-            round(_clamp(v, min_value, max_value), 1)
-            for v in options
-            if max_value > 0
-        }
-    )
-    return [v for v in out if v >= min_value and v <= max_value]
+def _round_options(options: Iterable[float], min_value: float, max_value: float) -> List[float]:
+    """Clamp, round and dedupe ascending size candidates in one pass."""
+    out: List[float] = []
+    if max_value <= 0:
+        return out
+    last = None
+    for v in options:
+        # Clamping and rounding are monotone, so equal values arrive adjacent.
+        v = round(max(min_value, min(max_value, v)), 1)
+        if v != last and min_value <= v <= max_value:
+            out.append(v)
+        last = v
+    return out
 
 
 def generate_scenario(payload: dict) -> dict:
@@ -278,7 +328,7 @@ def generate_scenario(payload: dict) -> dict:
 
     equal_stacks = bool(payload.get("equal_stacks", True))
     default_stack_bb = float(payload.get("default_stack_bb", DEFAULT_STACK_BB))
-    default_stack_bb = _clamp(default_stack_bb, 20.0, 400.0)
+    default_stack_bb = max(20.0, min(400.0, default_stack_bb))
 
     sb = float(payload.get("sb", DEFAULT_SB))
     bb = float(payload.get("bb", DEFAULT_BB))
@@ -311,12 +361,12 @@ def generate_scenario(payload: dict) -> dict:
                 archetype_key = override.get("archetype_key") or _default_archetype_for_position(position, rng)
                 if archetype_key not in ARCHETYPES:
                     archetype_key = "tag_reg"
-            archetype_label = archetype_by_key(archetype_key).label
+            archetype_label = _ARCHETYPE_LABELS[archetype_key]
 
         stack_bb = float(override.get("stack_bb", default_stack_bb))
         if equal_stacks:
             stack_bb = default_stack_bb
-        stack_bb = _clamp(stack_bb, 10.0, 500.0)
+        stack_bb = max(10.0, min(500.0, stack_bb))
 
         in_hand = bool(override.get("in_hand", True))
         if is_hero:
@@ -362,21 +412,16 @@ def generate_scenario(payload: dict) -> dict:
         [hero_stack] + [s.stack_bb for s in seats if s.in_hand and not s.is_hero]
     )
 
-    deck = full_deck()
-    hero_hand = rng.sample(deck, 2)
-    for c in hero_hand:
-        deck.remove(c)
-    board = []
-    board_count = _street_board_count(street)
-    if board_count > 0:
-        board = rng.sample(deck, board_count)
-        for c in board:
-            deck.remove(c)
+    # One draw deals hero and board together, so no dealt cards need removing.
+    dealt = rng.sample(_FULL_DECK, 2 + _street_board_count(street))
+    hero_hand = dealt[:2]
+    board = dealt[2:]
 
     if to_call_bb > 0:
         legal_actions = ["fold", "call", "raise"]
+        # The min-raise candidate clamps up to min_value, so it leads the ascending run.
         raise_options = _round_options(
-            [to_call_bb + pot_bb * p for p in BET_SIZE_PCTS] + [to_call_bb * 2.0],
+            [to_call_bb * 2.0] + [to_call_bb + pot_bb * p for p in _BET_PCTS_ASCENDING],
             min_value=max(to_call_bb * 2.0, to_call_bb + 1.0),
             max_value=max(2.0, effective_stack),
         )
@@ -386,7 +431,7 @@ def generate_scenario(payload: dict) -> dict:
     else:
         legal_actions = ["check", "bet"]
         bet_options = _round_options(
-            [pot_bb * p for p in BET_SIZE_PCTS],
+            [pot_bb * p for p in _BET_PCTS_ASCENDING],
             min_value=1.0,
             max_value=max(2.0, effective_stack),
         )
@@ -406,7 +451,7 @@ def generate_scenario(payload: dict) -> dict:
     )
 
     scenario_id = f"scn_{uuid.uuid4().hex[:12]}"
-    now_iso = datetime.now(timezone.utc).isoformat()
+    now_iso = _utc_now_iso()
     position_guidance = hero_profile.position_guidance(hero_position, street)
 
     return {
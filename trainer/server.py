@@ -2,35 +2,318 @@
 
 from __future__ import annotations
 
+import email.utils
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
 import webbrowser
-from functools import partial
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Optional
-from urllib.parse import parse_qs, urlparse
+from typing import Any, Callable, Dict, Hashable, Optional
+from urllib.parse import unquote_plus
 
 from trainer.service import TrainerService
 
+try:  # pragma: no cover - optional speedup for API payloads
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json keeps the server usable without it
+    orjson = None
+
+
+# The codec is picked once at import; both backends are stateless, so one shared
+# encoder/decoder serves every request thread.
+if orjson is not None:
+    _ORJSON_DUMPS = orjson.dumps
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+    def _json_bytes(payload: Any) -> bytes:
+        return _ORJSON_DUMPS(payload, option=_ORJSON_OPTIONS)
+
+    _json_loads: Callable[[bytes | bytearray], Any] = orjson.loads
+else:  # pragma: no cover - exercised only without orjson installed
+    _JSON_ENCODER = json.JSONEncoder()
+    # json.loads detects UTF-8 itself, so the buffer needn't be decoded to str first.
+    _json_loads = json.loads
+
+    def _json_bytes(payload: Any) -> bytes:
+        return _JSON_ENCODER.encode(payload).encode("utf-8")
+
+
+# Constant response header lines, encoded once.
+_SERVER_HEADER = (
+    f"Server: {SimpleHTTPRequestHandler.server_version} {SimpleHTTPRequestHandler.sys_version}\r\n"
+).encode("latin-1")
+_JSON_CONTENT_TYPE = b"Content-Type: application/json; charset=utf-8\r\n"
+_GZIP_HEADERS = b"Content-Encoding: gzip\r\nVary: Accept-Encoding\r\n"
+# (unix second, formatted Date header line); swapped as one tuple so threads never
+# pair a new second with a stale line.
+_DATE_HEADER: tuple[int, bytes] = (-1, b"")
+
+
+def _date_header() -> bytes:
+    """``Date:`` header line for now, formatted at most once per second."""
+    global _DATE_HEADER
+    second = int(time.time())
+    cached_second, line = _DATE_HEADER
+    if cached_second != second:
+        line = f"Date: {email.utils.formatdate(second, usegmt=True)}\r\n".encode("latin-1")
+        _DATE_HEADER = (second, line)
+    return line
+
+
+# Per-request access lines, emitted only when run_server(access_log=True).
+access_logger = logging.getLogger("trainer.http")
+
+# Bodies below this go out uncompressed; gzip framing isn't worth it for tiny payloads.
+_GZIP_MIN_BYTES = 1024
+
+
+def _gzip_bytes(data: bytes) -> bytes:
+    # Level 1 keeps compression cheap next to encoding; wbits=31 emits a gzip container.
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+def _gzip_acceptable(accept_encoding: str) -> bool:
+    """Whether an ``Accept-Encoding`` value allows gzip (``gzip``/``x-gzip``, else ``*``) at q > 0."""
+    wildcard = False
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if coding not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding == "*":
+            wildcard = q > 0
+        else:
+            # An explicit gzip entry wins over the wildcard either way.
+            return q > 0
+    return wildcard
+
+
+# Largest JSON request body accepted; hand-file uploads go through multipart instead.
+MAX_JSON_BODY = 8 * 1024 * 1024
+# Largest multipart hand-file upload accepted in one request: the service's batch
+# limit plus room for part headers and boundaries, so batches the service accepts
+# get through and oversized ones still reach its own "max per upload" message.
+MAX_UPLOAD_BODY = TrainerService.MAX_UPLOAD_BATCH_BYTES + 1024 * 1024
+
+
+class RequestBodyTooLarge(ValueError):
+    """Raised when a request body exceeds MAX_JSON_BODY or MAX_UPLOAD_BODY."""
+
+
+_HEALTH_BYTES = _json_bytes({"ok": True})
+
+
+def _query_param(query: str, name: str) -> Optional[str]:
+    """First non-blank value of ``name`` in a raw query string, decoded like parse_qs."""
+    if not query:
+        return None
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        if value and unquote_plus(key) == name:
+            return unquote_plus(value)
+    return None
+
+
+def _service_post(method_name: str) -> Callable[[TrainerRequestHandler], None]:
+    """POST route that passes the JSON body straight to a service method."""
+
+    def handle(handler: TrainerRequestHandler) -> None:
+        payload = handler._read_json_body()
+        handler._send_json(getattr(handler.service, method_name)(payload), status=200)
+
+    return handle
+
+
+class ResponseCache:
+    """Pre-encoded GET bodies shared by every handler instance of one server."""
+
+    def __init__(self, max_scenarios: int = 256) -> None:
+        self._lock = threading.Lock()
+        # Stored scenarios never change, only get deleted, so their encoded
+        # bodies stay valid until clear_saved_hands.
+        self._max_scenarios = max_scenarios
+        self._scenarios: OrderedDict[str, bytes] = OrderedDict()
+        self._scenario_generation = 0
+        self._inflight: Dict[Hashable, Future] = {}
+        # Bumped whenever a POST is about to answer; coalesced builds are keyed on
+        # it so a poll sent after a mutation's response never joins an older build.
+        self._write_generation = 0
+
+    def scenario(self, service: TrainerService, scenario_id: str) -> bytes:
+        with self._lock:
+            data = self._scenarios.get(scenario_id)
+            if data is not None:
+                self._scenarios.move_to_end(scenario_id)
+                return data
+            generation = self._scenario_generation
+        # Read and encode outside the lock so a cold fetch doesn't stall every
+        # other cached route. Unknown ids raise here and are never cached.
+        data = _json_bytes(service.get_scenario(scenario_id))
+        with self._lock:
+            # Skip the insert if clear_saved_hands ran while this was building.
+            if generation == self._scenario_generation:
+                self._scenarios[scenario_id] = data
+                self._scenarios.move_to_end(scenario_id)
+                if len(self._scenarios) > self._max_scenarios:
+                    self._scenarios.popitem(last=False)
+        return data
+
+    def invalidate_scenarios(self) -> None:
+        with self._lock:
+            self._scenarios.clear()
+            self._scenario_generation += 1
+
+    def mark_write(self) -> None:
+        """Stop in-flight coalesced builds from being joined by later requests."""
+        with self._lock:
+            self._write_generation += 1
+
+    def coalesce(self, key: Hashable, build: Callable[[], bytes]) -> bytes:
+        """Run ``build`` once for concurrent identical read-only requests and share its bytes.
+
+        Nothing is kept after the call finishes; this only collapses overlapping polls.
+        A request that arrives after any POST has answered starts its own build.
+        """
+        with self._lock:
+            key = (key, self._write_generation)
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+        if owner:
+            try:
+                future.set_result(build())
+            except BaseException as exc:
+                future.set_exception(exc)
+            finally:
+                with self._lock:
+                    del self._inflight[key]
+        return future.result()
+
 
 class TrainerRequestHandler(SimpleHTTPRequestHandler):
     """Serve static trainer UI + simple JSON API routes."""
 
+    # Keep connections open between API calls; every response sets Content-Length.
+    protocol_version = "HTTP/1.1"
+    # A request's line, headers and body must each arrive within this many seconds.
+    timeout = 5
+    # Between requests a kept-alive connection only waits this long, so idle
+    # browser sockets hand their pool worker back quickly.
+    keepalive_timeout = 1.0
+    # Buffer wfile so a response's headers and body go out in one write; the
+    # base handler flushes it after every request.
+    wbufsize = 64 * 1024
+    _OK_HEAD = f"{protocol_version} 200 OK\r\n".encode("latin-1") + _SERVER_HEADER
+
+    # Per-server defaults, bound as class attributes by make_handler_class so the
+    # server can instantiate handlers without per-connection keyword arguments.
+    service: TrainerService
+    web_directory: Optional[str] = None
+    response_cache: Optional[ResponseCache] = None
+    access_log = False
+
     def __init__(
         self,
         *args: Any,
-        service: TrainerService,
-        directory: str,
+        service: Optional[TrainerService] = None,
+        directory: Optional[str] = None,
+        response_cache: Optional[ResponseCache] = None,
+        access_log: Optional[bool] = None,
         **kwargs: Any,
     ):
-        self.service = service
-        super().__init__(*args, directory=directory, **kwargs)
+        if service is not None:
+            self.service = service
+        if response_cache is not None:
+            self.response_cache = response_cache
+        elif self.response_cache is None:
+            self.response_cache = ResponseCache()
+        if access_log is not None:
+            self.access_log = access_log
+        super().__init__(*args, directory=self.web_directory if directory is None else directory, **kwargs)
+
+    def handle(self) -> None:
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            self.connection.settimeout(self.keepalive_timeout)
+            self.handle_one_request()
+
+    def parse_request(self) -> bool:
+        # The next request line has arrived; the rest of it gets the full timeout.
+        self.connection.settimeout(self.timeout)
+        return super().parse_request()
 
     def _send_json(self, payload: Any, status: int = 200) -> None:
-        data = json.dumps(payload).encode("utf-8")
+        self._send_json_bytes(_json_bytes(payload), status=status)
+
+    def _send_json_error(self, message: str, status: int = 400) -> None:
+        # Error bodies always have one key, so only the message needs encoding.
+        self._send_json_bytes(b'{"error":' + _json_bytes(message) + b"}", status=status)
+
+    def _accepts_gzip(self) -> bool:
+        return _gzip_acceptable(str(self.headers.get("Accept-Encoding", "")))
+
+    def _send_header_line(self, line: bytes) -> None:
+        """send_header for a preformatted ``Name: value\\r\\n`` line."""
+        if self.request_version != "HTTP/0.9":
+            self._headers_buffer.append(line)
+
+    def _send_json_bytes(self, data: bytes, status: int = 200) -> None:
+        if self.command == "POST":
+            # The mutation (if any) has committed; polls from here on must not
+            # join a coalesced build that may have read the earlier state.
+            self.response_cache.mark_write()
+        encoding = b""
+        if len(data) >= _GZIP_MIN_BYTES and self._accepts_gzip():
+            data = _gzip_bytes(data)
+            encoding = _GZIP_HEADERS
+        if status == 200 and not self.close_connection:
+            # Common case: format the whole response in one buffer rather than
+            # going through send_response/send_header line by line.
+            self.log_request(200)
+            head = b"".join(
+                (
+                    self._OK_HEAD,
+                    _date_header(),
+                    _JSON_CONTENT_TYPE,
+                    encoding,
+                    b"Content-Length: %d\r\n\r\n" % len(data),
+                )
+            )
+            if len(data) < self.wbufsize:
+                self.wfile.write(head + data)
+            else:
+                # Too big to coalesce in the write buffer anyway: write the body
+                # straight through rather than copying it behind the headers.
+                self.wfile.write(head)
+                self.wfile.write(data)
+            return
         self.send_response(status)
-        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self._send_header_line(_JSON_CONTENT_TYPE)
+        if encoding:
+            self._send_header_line(encoding)
         self.send_header("Content-Length", str(len(data)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
         self.end_headers()
         self.wfile.write(data)
 
@@ -41,22 +324,52 @@ class TrainerRequestHandler(SimpleHTTPRequestHandler):
             length = 0
         if length <= 0:
             return {}
-        raw = self.rfile.read(length)
-        if not raw:
+        if length > MAX_JSON_BODY:
+            # The body is left unread, so the connection can't carry another request.
+            self.close_connection = True
+            raise RequestBodyTooLarge(f"Request body exceeds {MAX_JSON_BODY} bytes")
+        # Read straight into one buffer that orjson parses in place.
+        buf = bytearray(length)
+        got = 0
+        with memoryview(buf) as view:
+            while got < length:
+                n = self.rfile.readinto(view[got:])
+                if not n:
+                    break
+                got += n
+        if not got:
             return {}
-        return json.loads(raw.decode("utf-8"))
+        if got < length:
+            del buf[got:]
+        return _json_loads(buf)
+
+    def _discard_body(self) -> None:
+        """Consume an unused request body so the kept-alive connection stays in sync."""
+        try:
+            length = int(self.headers.get("Content-Length", "0"))
+        except ValueError:
+            length = 0
+        if length > MAX_JSON_BODY:
+            self.close_connection = True
+            return
+        while length > 0:
+            chunk = self.rfile.read(min(length, 64 * 1024))
+            if not chunk:
+                break
+            length -= len(chunk)
 
     def _read_multipart_files(self) -> list[tuple[str, bytes]]:
         content_type = str(self.headers.get("Content-Type", "")).strip()
-        if "multipart/form-data" not in content_type.lower():
-            return []
         boundary = ""
-        for part in content_type.split(";"):
-            token = part.strip()
-            if token.lower().startswith("boundary="):
-                boundary = token.split("=", 1)[1].strip().strip('"')
-                break
+        if "multipart/form-data" in content_type.lower():
+            for part in content_type.split(";"):
+                token = part.strip()
+                if token.lower().startswith("boundary="):
+                    boundary = token.split("=", 1)[1].strip().strip('"')
+                    break
         if not boundary:
+            # The body is left unread, so the connection can't carry another request.
+            self.close_connection = True
             return []
         try:
             length = int(self.headers.get("Content-Length", "0"))
@@ -64,148 +377,256 @@ class TrainerRequestHandler(SimpleHTTPRequestHandler):
             length = 0
         if length <= 0:
             return []
+        if length > MAX_UPLOAD_BODY:
+            self.close_connection = True
+            raise RequestBodyTooLarge(f"Upload exceeds {MAX_UPLOAD_BODY} bytes")
         raw = self.rfile.read(length)
         if not raw:
             return []
 
-        delimiter = f"--{boundary}".encode("utf-8")
+        # Walk the buffer with find() so each file body is copied exactly once;
+        # splitting first would hold every part (and its stripped copy) at once.
+        opener = f"--{boundary}".encode("utf-8")
+        delimiter = b"\r\n" + opener
         out: list[tuple[str, bytes]] = []
-        for part in raw.split(delimiter):
-            chunk = part.strip(b"\r\n")
-            if not chunk or chunk == b"--":
-                continue
-            if chunk.endswith(b"--"):
-                chunk = chunk[:-2]
-            header_blob, marker, body = chunk.partition(b"\r\n\r\n")
-            if not marker:
-                continue
-            headers_text = header_blob.decode("utf-8", errors="ignore")
-            disposition = ""
-            for header_line in headers_text.split("\r\n"):
-                if header_line.lower().startswith("content-disposition:"):
-                    disposition = header_line
-                    break
-            if 'name="files"' not in disposition:
-                continue
-            filename = ""
-            for token in disposition.split(";"):
-                token = token.strip()
-                if token.startswith("filename="):
-                    filename = token.split("=", 1)[1].strip().strip('"')
-                    break
-            if body.endswith(b"\r\n"):
-                body = body[:-2]
-            out.append((filename, bytes(body)))
+        pos = raw.find(opener)
+        while pos != -1:
+            start = pos + len(opener)
+            if raw.startswith(b"--", start):
+                break
+            end = raw.find(delimiter, start)
+            stop = len(raw) if end == -1 else end
+            header_end = raw.find(b"\r\n\r\n", start, stop)
+            if header_end != -1:
+                headers_text = raw[start:header_end].decode("utf-8", errors="ignore")
+                disposition = ""
+                for header_line in headers_text.split("\r\n"):
+                    if header_line.lower().startswith("content-disposition:"):
+                        disposition = header_line
+                        break
+                if 'name="files"' in disposition:
+                    filename = ""
+                    for token in disposition.split(";"):
+                        token = token.strip()
+                        if token.startswith("filename="):
+                            filename = token.split("=", 1)[1].strip().strip('"')
+                            break
+                    out.append((filename, raw[header_end + 4 : stop]))
+            pos = -1 if end == -1 else end + 2
         return out
 
+    def copyfile(self, source: Any, outputfile: Any) -> None:
+        if outputfile is not self.wfile:
+            super().copyfile(source, outputfile)
+            return
+        # Static assets: push buffered headers out, then let socket.sendfile use
+        # os.sendfile (zero-copy, timeout-aware) with its own send() fallback.
+        outputfile.flush()
+        self.connection.sendfile(source)
+
+    def log_error(self, format: str, *args: Any) -> None:
+        # An idle keep-alive connection timing out is routine, not an error.
+        if args and isinstance(args[0], TimeoutError):
+            return
+        # Errors always reach stderr, whether or not access logging is on.
+        super().log_message(format, *args)
+
     def log_message(self, format: str, *args: Any) -> None:
-        # Keep terminal output concise while running drills.
-        return super().log_message(format, *args)
+        # Keep terminal output concise while running drills: access lines are
+        # off by default and otherwise handed to a queue-backed logger.
+        if self.access_log:
+            access_logger.info("%s - %s", self.address_string(), format % args)
 
-    def do_GET(self) -> None:  # noqa: N802
-        parsed = urlparse(self.path)
-        path = parsed.path
-        query = parse_qs(parsed.query)
-        if path == "/api/config":
-            self._send_json(self.service.app_config())
+    def _get_config(self, query: str) -> None:
+        # The service keeps the encoded body until the hand files on disk change.
+        self._send_json_bytes(self.service.app_config_json())
+
+    def _get_scenario(self, query: str) -> None:
+        scenario_id = _query_param(query, "scenario_id")
+        if not scenario_id:
+            self._send_json_error("scenario_id is required", status=400)
             return
-        if path == "/api/scenario":
-            scenario_id = (query.get("scenario_id") or [None])[0]
-            if not scenario_id:
-                self._send_json({"error": "scenario_id is required"}, status=400)
-                return
-            self._send_json(self.service.get_scenario(scenario_id))
+        self._send_json_bytes(self.response_cache.scenario(self.service, scenario_id))
+
+    def _get_opponent_profile(self, query: str) -> None:
+        name = _query_param(query, "name")
+        if not name:
+            self._send_json_error("name is required", status=400)
             return
-        if path == "/api/opponent_profile":
-            name = (query.get("name") or [None])[0]
-            if not name:
-                self._send_json({"error": "name is required"}, status=400)
-                return
-            self._send_json(self.service.analyzer_profile(str(name)))
+        self._send_json(self.service.analyzer_profile(name))
+
+    def _get_opponent_compare(self, query: str) -> None:
+        self._send_json_error("Use POST /api/opponent/compare", status=405)
+
+    def _get_hands_players(self, query: str) -> None:
+        service = self.service
+        self._send_json_bytes(
+            self.response_cache.coalesce(("hands_players",), lambda: _json_bytes(service.hands_players()))
+        )
+
+    def _get_live_state(self, query: str) -> None:
+        session_id = _query_param(query, "session_id")
+        if not session_id:
+            self._send_json_error("session_id is required", status=400)
             return
-        if path == "/api/opponent/compare":
-            self._send_json({"error": "Use POST /api/opponent/compare"}, status=405)
+        service = self.service
+        self._send_json_bytes(
+            self.response_cache.coalesce(
+                ("live_state", session_id), lambda: _json_bytes(service.live_state(session_id))
+            )
+        )
+
+    def _get_health(self, query: str) -> None:
+        self._send_json_bytes(_HEALTH_BYTES)
+
+    def _post_hands_upload(self) -> None:
+        result = self.service.upload_hands(self._read_multipart_files())
+        self._send_json(result, status=200)
+
+    def _post_hands_delete(self) -> None:
+        payload = self._read_json_body()
+        filename = str(payload.get("filename", "")).strip()
+        if not filename:
+            self._send_json_error("filename is required", status=400)
             return
-        if path == "/api/hands/players":
-            self._send_json(self.service.hands_players())
+        result = self.service.delete_uploaded_hands_file(filename)
+        self._send_json(result, status=200)
+
+    def _post_opponent_compare(self) -> None:
+        payload = self._read_json_body()
+        groups = payload.get("groups")
+        if not isinstance(groups, list) or not groups:
+            self._send_json_error("groups is required and must be a list", status=400)
             return
-        if path == "/api/live/state":
-            session_id = (query.get("session_id") or [None])[0]
-            if not session_id:
-                self._send_json({"error": "session_id is required"}, status=400)
+        out = []
+        for idx, group in enumerate(groups):
+            if not isinstance(group, dict):
+                self._send_json_error("Each group must be an object", status=400)
                 return
-            self._send_json(self.service.live_state(str(session_id)))
-            return
-        if path == "/api/health":
-            self._send_json({"ok": True})
+            usernames = group.get("usernames")
+            aliases = [str(v).strip() for v in (usernames or []) if str(v).strip()]
+            if not aliases:
+                self._send_json_error(f"Group {idx + 1} requires at least one username", status=400)
+                return
+            prof = self.service.analyzer_profile(",".join(aliases))
+            prof["group_label"] = str(group.get("label", f"Player {idx + 1}")).strip() or f"Player {idx + 1}"
+            out.append(prof)
+        self._send_json({"profiles": out}, status=200)
+
+    def _post_clear_saved_hands(self) -> None:
+        self._discard_body()
+        result = self.service.clear_saved_hands()
+        self.response_cache.invalidate_scenarios()
+        self._send_json(result, status=200)
+
+    _GET_ROUTES: Dict[str, Callable[[TrainerRequestHandler, str], None]] = {
+        "/api/config": _get_config,
+        "/api/scenario": _get_scenario,
+        "/api/opponent_profile": _get_opponent_profile,
+        "/api/opponent/compare": _get_opponent_compare,
+        "/api/hands/players": _get_hands_players,
+        "/api/live/state": _get_live_state,
+        "/api/health": _get_health,
+    }
+    _POST_ROUTES: Dict[str, Callable[[TrainerRequestHandler], None]] = {
+        "/api/hands/upload": _post_hands_upload,
+        "/api/hands/delete": _post_hands_delete,
+        "/api/opponent/compare": _post_opponent_compare,
+        "/api/generate": _service_post("generate"),
+        "/api/evaluate": _service_post("evaluate"),
+        "/api/clear_saved_hands": _post_clear_saved_hands,
+        "/api/live/start": _service_post("live_start"),
+        "/api/live/action": _service_post("live_action"),
+        "/api/live/new_hand": _service_post("live_new_hand"),
+    }
+
+    # Page aliases served from static .html files.
+    _STATIC_REWRITES = {
+        "/": "/index.html",
+        "/index": "/index.html",
+        "/setup": "/setup.html",
+        "/download-guide": "/download-guide.html",
+        "/tutorial": "/download-guide.html",
+        "/trainer": "/trainer.html",
+        "/play": "/play.html",
+    }
+
+    def do_GET(self) -> None:  # noqa: N802
+        # Request targets are origin-form paths, so splitting on "?" is all the
+        # URL parsing needed; routes pull single values from the raw query.
+        qidx = self.path.find("?")
+        path = self.path if qidx < 0 else self.path[:qidx]
+        route = self._GET_ROUTES.get(path)
+        if route is not None:
+            route(self, "" if qidx < 0 else self.path[qidx + 1 :])
             return
-        if path in {"/", "/index"}:
-            self.path = "/index.html"
-        elif path == "/setup":
-            self.path = "/setup.html"
-        elif path in {"/download-guide", "/tutorial"}:
-            self.path = "/download-guide.html"
-        elif path == "/trainer":
-            self.path = "/trainer.html"
-        elif path == "/play":
-            self.path = "/play.html"
+        rewrite = self._STATIC_REWRITES.get(path)
+        if rewrite is not None:
+            self.path = rewrite
         return super().do_GET()
 
     def do_POST(self) -> None:  # noqa: N802
-        path = urlparse(self.path).path
+        qidx = self.path.find("?")
+        path = self.path if qidx < 0 else self.path[:qidx]
         try:
-            if path == "/api/hands/upload":
-                self._send_json(self.service.upload_hands(self._read_multipart_files()), status=200)
-                return
-            payload = self._read_json_body()
-            if path == "/api/hands/delete":
-                filename = str(payload.get("filename", "")).strip()
-                if not filename:
-                    self._send_json({"error": "filename is required"}, status=400)
-                    return
-                self._send_json(self.service.delete_uploaded_hands_file(filename), status=200)
-                return
-            if path == "/api/opponent/compare":
-                groups = payload.get("groups")
-                if not isinstance(groups, list) or not groups:
-                    self._send_json({"error": "groups is required and must be a list"}, status=400)
-                    return
-                out = []
-                for idx, group in enumerate(groups):
-                    if not isinstance(group, dict):
-                        self._send_json({"error": "Each group must be an object"}, status=400)
-                        return
-                    usernames = group.get("usernames")
-                    aliases = [str(v).strip() for v in (usernames or []) if str(v).strip()]
-                    if not aliases:
-                        self._send_json({"error": f"Group {idx + 1} requires at least one username"}, status=400)
-                        return
-                    prof = self.service.analyzer_profile(",".join(aliases))
-                    prof["group_label"] = str(group.get("label", f"Player {idx + 1}")).strip() or f"Player {idx + 1}"
-                    out.append(prof)
-                self._send_json({"profiles": out}, status=200)
-                return
-            if path == "/api/generate":
-                self._send_json(self.service.generate(payload), status=200)
-                return
-            if path == "/api/evaluate":
-                self._send_json(self.service.evaluate(payload), status=200)
-                return
-            if path == "/api/clear_saved_hands":
-                self._send_json(self.service.clear_saved_hands(), status=200)
-                return
-            if path == "/api/live/start":
-                self._send_json(self.service.live_start(payload), status=200)
+            route = self._POST_ROUTES.get(path)
+            if route is None:
+                self._discard_body()
+                self._send_json_error(f"Unknown endpoint: {path}", status=404)
                 return
-            if path == "/api/live/action":
-                self._send_json(self.service.live_action(payload), status=200)
-                return
-            if path == "/api/live/new_hand":
-                self._send_json(self.service.live_new_hand(payload), status=200)
-                return
-            self._send_json({"error": f"Unknown endpoint: {path}"}, status=404)
+            route(self)
+        except RequestBodyTooLarge as exc:
+            self._send_json_error(str(exc), status=413)
+        except TimeoutError:
+            # The client stalled mid-body (handler timeout); drop the connection
+            # rather than answer into a stream that is out of sync.
+            self.close_connection = True
         except Exception as exc:  # noqa: BLE001
-            self._send_json({"error": str(exc)}, status=400)
+            if path == "/api/clear_saved_hands":
+                # A failed clear may still have deleted some scenarios.
+                self.response_cache.invalidate_scenarios()
+            self._send_json_error(str(exc), status=400)
+
+
+def make_handler_class(
+    service: TrainerService,
+    directory: str,
+    response_cache: Optional[ResponseCache] = None,
+    access_log: bool = False,
+) -> type[TrainerRequestHandler]:
+    """TrainerRequestHandler subclass with one server's service, web root and cache bound."""
+    return type(
+        "BoundTrainerRequestHandler",
+        (TrainerRequestHandler,),
+        {
+            "service": service,
+            "web_directory": directory,
+            "response_cache": ResponseCache() if response_cache is None else response_cache,
+            "access_log": access_log,
+        },
+    )
+
+
+# Well above the ~6 connections a browser opens per page load, so a few idle
+# kept-alive clients can't occupy every worker.
+DEFAULT_HTTP_THREADS = max(32, (os.cpu_count() or 1) * 4)
+
+
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that serves connections from a fixed-size worker pool."""
+
+    def __init__(self, server_address: Any, handler: Any, http_threads: int = DEFAULT_HTTP_THREADS):
+        self._pool = ThreadPoolExecutor(max_workers=max(1, http_threads), thread_name_prefix="trainer-http")
+        super().__init__(server_address, handler)
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        # Connections beyond the pool size wait in the executor queue instead of
+        # each spawning a thread.
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 def run_server(
@@ -213,11 +634,26 @@ def run_server(
     host: str = "127.0.0.1",
     port: int = 8787,
     open_browser: bool = True,
+    http_threads: int = DEFAULT_HTTP_THREADS,
+    access_log: bool = False,
 ) -> None:
-    """Run trainer web server until interrupted."""
+    """Run trainer web server until interrupted; ``http_threads`` caps concurrent connections."""
     web_root = Path(__file__).resolve().parent / "web"
-    handler = partial(TrainerRequestHandler, service=service, directory=str(web_root))
-    server = ThreadingHTTPServer((host, port), handler)
+    handler = make_handler_class(service, str(web_root), access_log=access_log)
+    listener: Optional[logging.handlers.QueueListener] = None
+    queue_handler: Optional[logging.handlers.QueueHandler] = None
+    if access_log:
+        # Request threads only enqueue; one background thread writes to stderr.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        stream = logging.StreamHandler(sys.stderr)
+        stream.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        listener = logging.handlers.QueueListener(log_queue, stream)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        access_logger.addHandler(queue_handler)
+        access_logger.setLevel(logging.INFO)
+        access_logger.propagate = False
+        listener.start()
+    server = PooledHTTPServer((host, port), handler, http_threads=http_threads)
     url = f"http://{host}:{port}"
     print(f"Trainer running at {url}")
     if open_browser:
@@ -228,3 +664,6 @@ def run_server(
         pass
     finally:
         server.server_close()
+        if listener is not None:
+            access_logger.removeHandler(queue_handler)
+            listener.stop()
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
 import hashlib
 import json
 import math
+import os
 import re
+import sys
 import threading
 import time
 from pathlib import Path
@@ -27,17 +32,89 @@ from trainer.live_play import LiveMatch
 from trainer.scenario import generate_scenario
 from trainer.storage import TrainerStore
 
+try:  # pragma: no cover - optional speedup for parsing uploaded hand files
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json keeps uploads working without it
+    orjson = None
+
+
+def _loads_json_bytes(raw: bytes) -> Any:
+    """Parse a UTF-8 JSON document straight from bytes; raises ValueError when invalid."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+def _dumps_json_bytes(payload: Any) -> bytes:
+    if orjson is not None:
+        # Match stdlib json, which stringifies int keys such as POSITION_SETS'.
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Runs of characters not allowed in stored upload names / user-scope slugs.
+_UNSAFE_FILENAME_RUN = re.compile(r"[^A-Za-z0-9._-]+")
+_UNSAFE_SCOPE_RUN = re.compile(r"[^a-z0-9]+")
+# Name lists may be separated by commas, semicolons or newlines; fold them all to commas.
+_NAME_SEPARATORS = str.maketrans({"\n": ",", ";": ","})
+
+# Per-directory sidecar holding parsed hand-file summaries across restarts. The
+# name doesn't end in .json, so it never shows up as an uploaded hand file.
+_HAND_INDEX_SIDECAR_NAME = ".player_index_cache"
+_HAND_INDEX_SIDECAR_VERSION = 1
+
+
+@dataclass(slots=True)
+class _PlayerBucket:
+    """Uploaded hands seen for one player id, across every alias it appeared under."""
+
+    player_id: str
+    usernames: Set[str] = field(default_factory=set)
+    hands_seen: int = 0
+    files: Set[str] = field(default_factory=set)
+
 
 class TrainerService:
     """High-level API used by HTTP handlers and scripts."""
 
     MAX_UPLOAD_FILE_BYTES = 15 * 1024 * 1024
     MAX_UPLOAD_BATCH_BYTES = 100 * 1024 * 1024
+    # (field, rounding digits) averaged by hands when several players are aggregated.
+    AGGREGATED_STAT_FIELDS: Tuple[Tuple[str, int], ...] = (
+        ("vpip", 4),
+        ("pfr", 4),
+        ("three_bet", 4),
+        ("fold_to_3bet", 4),
+        ("limp_rate", 4),
+        ("af", 3),
+        ("aggression_frequency", 4),
+        ("flop_cbet", 4),
+        ("turn_cbet", 4),
+        ("river_cbet", 4),
+        ("double_barrel", 4),
+        ("triple_barrel", 4),
+        ("check_raise", 4),
+        ("wtsd", 4),
+        ("w_sd", 4),
+    )
 
     def __init__(self, db_path: Path):
         self.store = TrainerStore(db_path=db_path)
         self.live_sessions: Dict[str, LiveMatch] = {}
-        self._profile_cache: Dict[str, Dict[str, Any]] = {}
+        # (hands snapshot signature, profile cache key) -> built profile, least recent first
+        self._profile_cache: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+        self._profile_cache_max = 256
+        # (snapshot, scope, include_exploits, sorted player ids) -> per-player profile dicts
+        self._player_profiles_cache: OrderedDict[Tuple[Any, ...], List[dict]] = OrderedDict()
+        # user scope -> (hands snapshot signature, _uploaded_player_index result)
+        self._player_index_cache: Dict[str, Tuple[str, Tuple[Dict[str, _PlayerBucket], Dict[str, Set[str]], int]]] = {}
+        # (upload dir, file name) -> ((size, mtime_ns), _summarize_hand_file result)
+        self._hand_file_cache: Dict[Tuple[str, str], Tuple[Tuple[int, int], Any]] = {}
+        self._hand_file_sidecars_loaded: Set[str] = set()
+        self._hand_file_sidecars_dirty: Set[str] = set()
+        # user scope -> (hands snapshot signature, encoded app_config), least recent first
+        self._app_config_cache: OrderedDict[str, Tuple[str, bytes]] = OrderedDict()
+        self._app_config_cache_max = 128
         self._evaluation_cache: Dict[str, Dict[str, Any]] = {}
         self._evaluation_cache_ttl_sec = 300
         self._evaluation_cache_max = 256
@@ -49,11 +126,14 @@ class TrainerService:
         self._uploaded_hands_root_dir.mkdir(parents=True, exist_ok=True)
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _user_scope_slug(user_scope: str | None) -> str:
+        # Resolved several times per request (hands dir, snapshot, index), so the
+        # regex pass and sha256 run once per distinct scope.
         raw = str(user_scope or "").strip().lower()
         if not raw:
             return "shared"
-        safe_hint = re.sub(r"[^a-z0-9]+", "_", raw.split("@", 1)[0]).strip("_") or "user"
+        safe_hint = _UNSAFE_SCOPE_RUN.sub("_", raw.split("@", 1)[0]).strip("_") or "user"
         digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
         return f"{safe_hint}_{digest}"
 
@@ -71,7 +151,7 @@ class TrainerService:
         raw = Path(str(filename or "")).name
         if not raw:
             raw = f"upload_{fallback_index}.json"
-        safe = re.sub(r"[^A-Za-z0-9._-]+", "_", raw)
+        safe = _UNSAFE_FILENAME_RUN.sub("_", raw)
         if not safe.lower().endswith(".json"):
             safe = f"{safe}.json"
         return safe
@@ -84,7 +164,7 @@ class TrainerService:
             text = str(player_name or "").strip()
             if not text:
                 return []
-            tokens = [part.strip() for part in re.split(r"[,\n;]+", text)]
+            tokens = [part.strip() for part in text.translate(_NAME_SEPARATORS).split(",")]
         return [token for token in tokens if token]
 
     @staticmethod
@@ -188,74 +268,217 @@ class TrainerService:
             return []
         return sorted(upload_dir.glob("*.json"))
 
+    @staticmethod
+    def _summarize_hand_file(raw: Any) -> Tuple[int, List[Tuple[str, str, Tuple[str, ...], int]]] | None:
+        """
+        Reduce a parsed hand file to the few fields the player index needs.
+
+        Returns:
+            (hand_count, [(id_key, player_id, usernames, hands_seen), ...]) in
+            first-seen order, or None when the file holds no hand list.
+        """
+        hands = raw.get("hands", raw) if isinstance(raw, dict) else raw
+        if not isinstance(hands, list):
+            return None
+        rows: Dict[str, Tuple[str, Dict[str, None], List[int]]] = {}
+
+        def normalize(raw_id: Any, raw_name: Any) -> Tuple[str, List[int]] | None:
+            # Interned: the same few names recur in every file, and the index
+            # keeps them in many bucket sets and alias keys.
+            player_id = sys.intern(str(raw_id).strip())
+            username = sys.intern(str(raw_name).strip() or player_id)
+            if not player_id or not username:
+                return None
+            id_key = sys.intern(player_id.lower())
+            row = rows.get(id_key)
+            if row is None:
+                row = rows[id_key] = (player_id, {}, [0])
+            row[1][username] = None
+            return id_key, row[2]
+
+        # The same few players repeat across every hand, so each distinct raw
+        # (id, name) pair is normalized once and later seats are a dict hit.
+        slots: Dict[Tuple[Any, Any], Tuple[str, List[int]] | None] = {}
+        for hand in hands:
+            if not isinstance(hand, dict):
+                continue
+            seen_ids_in_hand: Set[str] = set()
+            for player in hand.get("players", []) or []:
+                if not isinstance(player, dict):
+                    continue
+                pair = (player.get("id", ""), player.get("name", ""))
+                try:
+                    slot = slots[pair]
+                except KeyError:
+                    slot = slots[pair] = normalize(*pair)
+                except TypeError:
+                    slot = normalize(*pair)
+                if slot is None:
+                    continue
+                id_key, counter = slot
+                if id_key not in seen_ids_in_hand:
+                    counter[0] += 1
+                    seen_ids_in_hand.add(id_key)
+        return len(hands), [
+            (id_key, player_id, tuple(usernames), counter[0])
+            for id_key, (player_id, usernames, counter) in rows.items()
+        ]
+
+    def _load_hand_file_sidecar(self, upload_dir: Path) -> None:
+        """Seed the per-file summary cache from a directory's sidecar, once per process."""
+        dir_key = str(upload_dir)
+        if dir_key in self._hand_file_sidecars_loaded:
+            return
+        self._hand_file_sidecars_loaded.add(dir_key)
+        try:
+            raw = _loads_json_bytes((upload_dir / _HAND_INDEX_SIDECAR_NAME).read_bytes())
+        except (OSError, ValueError):
+            return
+        if not isinstance(raw, dict) or raw.get("version") != _HAND_INDEX_SIDECAR_VERSION:
+            return
+        try:
+            for name, (size, mtime_ns, summary) in dict(raw.get("files") or {}).items():
+                if summary is not None:
+                    hand_count, rows = summary
+                    summary = (
+                        int(hand_count),
+                        [
+                            (
+                                sys.intern(str(r[0])),
+                                sys.intern(str(r[1])),
+                                tuple(sys.intern(str(u)) for u in r[2]),
+                                int(r[3]),
+                            )
+                            for r in rows
+                        ],
+                    )
+                self._hand_file_cache.setdefault((dir_key, str(name)), ((int(size), int(mtime_ns)), summary))
+        except (TypeError, ValueError, IndexError):
+            # A malformed sidecar only costs a re-parse; entries are re-stamped on use.
+            return
+
+    def _write_hand_file_sidecar(self, upload_dir: Path) -> None:
+        dir_key = str(upload_dir)
+        files = {
+            name: [stamp[0], stamp[1], summary]
+            for (entry_dir, name), (stamp, summary) in list(self._hand_file_cache.items())
+            if entry_dir == dir_key
+        }
+        target = upload_dir / _HAND_INDEX_SIDECAR_NAME
+        tmp_path = upload_dir / f"{_HAND_INDEX_SIDECAR_NAME}.{threading.get_ident()}.tmp"
+        try:
+            tmp_path.write_bytes(
+                _dumps_json_bytes({"version": _HAND_INDEX_SIDECAR_VERSION, "files": files})
+            )
+            os.replace(tmp_path, target)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
     def _uploaded_player_index(
         self,
         user_scope: str | None = None,
-    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Set[str]], int]:
+    ) -> Tuple[Dict[str, _PlayerBucket], Dict[str, Set[str]], int]:
         """
         Build player buckets keyed by player id plus an alias lookup.
 
         Returns:
             (by_player_id, alias_to_player_id_keys, total_hands)
+
+        The result is shared between callers until the hand files change, so
+        callers must treat it as read-only.
         """
-        by_player_id: Dict[str, Dict[str, Any]] = {}
+        scope_key = str(user_scope or "")
+        signature = self._hands_snapshot_signature(user_scope)
+        cached = self._player_index_cache.get(scope_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        by_player_id: Dict[str, _PlayerBucket] = {}
         alias_to_ids: Dict[str, Set[str]] = {}
         total_hands = 0
+        # Files are only re-parsed when their size or mtime changes, so an upload
+        # costs the new file's bytes rather than a rescan of the whole directory.
+        upload_path = self._uploaded_hands_dir(user_scope)
+        upload_dir = str(upload_path)
+        self._load_hand_file_sidecar(upload_path)
+        file_cache = self._hand_file_cache
+        live_names: Set[str] = set()
+        changed = upload_dir in self._hand_file_sidecars_dirty
         for file_path in self._uploaded_hand_files(user_scope):
             try:
-                raw = json.loads(file_path.read_text(encoding="utf-8"))
-            except (OSError, ValueError):
+                st = file_path.stat()
+            except OSError:
                 continue
-            hands = raw.get("hands", raw if isinstance(raw, list) else [])
-            if not isinstance(hands, list):
+            # Path.name builds a new string on every access; take it once per file.
+            file_name = file_path.name
+            cache_key = (upload_dir, file_name)
+            stamp = (st.st_size, st.st_mtime_ns)
+            live_names.add(file_name)
+            cached_file = file_cache.get(cache_key)
+            if cached_file is not None and cached_file[0] == stamp:
+                summary = cached_file[1]
+            else:
+                try:
+                    summary = self._summarize_hand_file(_loads_json_bytes(file_path.read_bytes()))
+                except (OSError, ValueError):
+                    summary = None
+                file_cache[cache_key] = (stamp, summary)
+                changed = True
+            if summary is None:
                 continue
-            total_hands += len(hands)
-            for hand in hands:
-                if not isinstance(hand, dict):
-                    continue
-                seen_ids_in_hand: Set[str] = set()
-                for player in hand.get("players", []) or []:
-                    if not isinstance(player, dict):
-                        continue
-                    player_id = str(player.get("id", "")).strip()
-                    username = str(player.get("name", "")).strip() or player_id
-                    if not player_id or not username:
-                        continue
-                    id_key = player_id.lower()
-                    entry = by_player_id.setdefault(
-                        id_key,
-                        {
-                            "player_id": player_id,
-                            "usernames": set(),
-                            "hands_seen": 0,
-                            "files": set(),
-                        },
-                    )
-                    entry["usernames"].add(username)
-                    entry["files"].add(file_path.name)
-                    alias_to_ids.setdefault(username.lower(), set()).add(id_key)
-                    if id_key not in seen_ids_in_hand:
-                        entry["hands_seen"] += 1
-                        seen_ids_in_hand.add(id_key)
-        return by_player_id, alias_to_ids, total_hands
+            hand_count, rows = summary
+            total_hands += hand_count
+            for id_key, player_id, usernames, hands_seen in rows:
+                entry = by_player_id.get(id_key)
+                if entry is None:
+                    entry = by_player_id[id_key] = _PlayerBucket(player_id)
+                known = entry.usernames
+                for username in usernames:
+                    # Only a name new to this bucket needs its alias key built;
+                    # repeats across files are the common case.
+                    if username not in known:
+                        known.add(username)
+                        alias_to_ids.setdefault(username.lower(), set()).add(id_key)
+                entry.files.add(file_name)
+                entry.hands_seen += hands_seen
+        for cache_key in list(file_cache):
+            if cache_key[0] == upload_dir and cache_key[1] not in live_names:
+                file_cache.pop(cache_key, None)
+                changed = True
+        if changed:
+            self._hand_file_sidecars_dirty.discard(upload_dir)
+            self._write_hand_file_sidecar(upload_path)
+        result = (by_player_id, alias_to_ids, total_hands)
+        self._player_index_cache[scope_key] = (signature, result)
+        return result
 
     def hands_players(self, user_scope: str | None = None) -> Dict[str, Any]:
         by_player_id, _alias_to_ids, total_hands = self._uploaded_player_index(user_scope)
-        players = sorted(
-            (
-                {
-                    "selection_key": f"id:{entry['player_id']}",
-                    "player_id": entry["player_id"],
-                    "username": sorted(entry["usernames"], key=str.lower)[0],
-                    "display_name": " / ".join(sorted(entry["usernames"], key=str.lower)),
-                    "usernames": sorted(entry["usernames"], key=str.lower),
-                    "hands_seen": int(entry["hands_seen"]),
-                    "player_ids": [entry["player_id"]],
-                }
-                for entry in by_player_id.values()
-            ),
-            key=lambda row: (-row["hands_seen"], row["display_name"].lower()),
-        )
+        keyed_rows: List[Tuple[int, str, Dict[str, Any]]] = []
+        for entry in by_player_id.values():
+            usernames = sorted(entry.usernames, key=str.lower)
+            display_name = " / ".join(usernames)
+            hands_seen = int(entry.hands_seen)
+            keyed_rows.append(
+                (
+                    -hands_seen,
+                    display_name.lower(),
+                    {
+                        "selection_key": f"id:{entry.player_id}",
+                        "player_id": entry.player_id,
+                        "username": usernames[0],
+                        "display_name": display_name,
+                        "usernames": usernames,
+                        "hands_seen": hands_seen,
+                        "player_ids": [entry.player_id],
+                    },
+                )
+            )
+        # Sort on the precomputed key pair; the row dict itself is never compared.
+        keyed_rows.sort(key=itemgetter(0, 1))
+        players = [row for _neg_hands, _name_key, row in keyed_rows]
         files = self._uploaded_hand_files(user_scope)
         return {
             "players": players,
@@ -265,6 +488,55 @@ class TrainerService:
             "total_files": len(files),
         }
 
+    def _upload_limit_violation(
+        self,
+        user_scope: str | None,
+        summaries: List[Any],
+        *,
+        max_total_hands: int | None,
+        max_hands_per_bucket: int | None,
+    ) -> str | None:
+        """
+        Check plan limits against the cached index plus not-yet-written summaries.
+
+        Returns the rejection message, or None when the upload fits.
+        """
+        if max_total_hands is None and max_hands_per_bucket is None:
+            return None
+        by_player_id, _alias_to_ids, total_hands = self._uploaded_player_index(user_scope)
+        incoming = [summary for summary in summaries if summary is not None]
+        if max_total_hands is not None:
+            projected_total = total_hands + sum(hand_count for hand_count, _rows in incoming)
+            if projected_total > int(max_total_hands):
+                return (
+                    f"Upload exceeds plan limit of {int(max_total_hands)} total hands. "
+                    f"Current uploaded hands: {int(total_hands)}."
+                )
+        if max_hands_per_bucket is None:
+            return None
+        bucket_limit = int(max_hands_per_bucket)
+        buckets: Dict[str, Tuple[Set[str], int]] = {
+            id_key: (entry.usernames, int(entry.hands_seen))
+            for id_key, entry in by_player_id.items()
+        }
+        for _hand_count, rows in incoming:
+            for id_key, _player_id, usernames, hands_seen in rows:
+                names, seen = buckets.get(id_key, (set(), 0))
+                buckets[id_key] = (names | set(usernames), seen + hands_seen)
+        violating = []
+        for names, hands_seen in buckets.values():
+            if hands_seen > bucket_limit:
+                display_name = " / ".join(sorted(names, key=str.lower)) or "unknown"
+                violating.append({"name": display_name, "hands_seen": hands_seen})
+        if not violating:
+            return None
+        violating.sort(key=lambda item: (-item["hands_seen"], item["name"].lower()))
+        top = ", ".join(f"{entry['name']} ({entry['hands_seen']})" for entry in violating[:3])
+        return (
+            f"Upload exceeds plan limit of {bucket_limit} hands per player bucket. "
+            f"Top bucket(s): {top}."
+        )
+
     def upload_hands(
         self,
         file_items: List[Tuple[str, bytes]],
@@ -294,9 +566,8 @@ class TrainerService:
                 )
             safe_name = self._sanitize_upload_filename(filename, idx + 1)
             try:
-                decoded = blob.decode("utf-8")
-                payload = json.loads(decoded)
-            except (UnicodeDecodeError, ValueError) as exc:
+                payload = _loads_json_bytes(blob)
+            except ValueError as exc:
                 raise ValueError(f"Invalid JSON file: {filename}") from exc
 
             hands = payload.get("hands", payload if isinstance(payload, list) else [])
@@ -306,23 +577,45 @@ class TrainerService:
             prepared.append(
                 {
                     "safe_name": safe_name,
-                    "decoded": decoded,
+                    "blob": blob,
                     "original_filename": str(filename or ""),
                     "hands_in_file": len(hands),
+                    # Summarized now so the index never has to re-parse the stored copy.
+                    "summary": self._summarize_hand_file(payload),
                 }
             )
+            del payload, hands
 
         if not prepared:
             raise ValueError("No usable JSON files were uploaded")
 
+        violation = self._upload_limit_violation(
+            user_scope,
+            [item["summary"] for item in prepared],
+            max_total_hands=max_total_hands,
+            max_hands_per_bucket=max_hands_per_bucket,
+        )
+        if violation:
+            raise ValueError(violation)
+
         saved: List[Dict[str, Any]] = []
         written_paths: List[Path] = []
         upload_dir = self._uploaded_hands_dir(user_scope)
         for idx, item in enumerate(prepared):
             target_name = f"{int(time.time())}_{idx + 1}_{item['safe_name']}"
             target_path = upload_dir / target_name
-            target_path.write_text(str(item["decoded"]), encoding="utf-8")
+            target_path.write_bytes(item["blob"])
             written_paths.append(target_path)
+            try:
+                st = target_path.stat()
+            except OSError:
+                pass
+            else:
+                self._hand_file_cache[(str(upload_dir), target_name)] = (
+                    (st.st_size, st.st_mtime_ns),
+                    item["summary"],
+                )
+                self._hand_file_sidecars_dirty.add(str(upload_dir))
             saved.append(
                 {
                     "original_filename": str(item["original_filename"]),
@@ -332,42 +625,27 @@ class TrainerService:
             )
 
         status = self.hands_players(user_scope)
-        def _rollback_uploads() -> Dict[str, Any]:
+        # Backstop for a concurrent upload into the same scope slipping past the
+        # pre-write check; the common rejection never touches the disk.
+        violation = self._upload_limit_violation(
+            user_scope,
+            [],
+            max_total_hands=max_total_hands,
+            max_hands_per_bucket=max_hands_per_bucket,
+        )
+        if violation:
             for path in written_paths:
                 try:
                     path.unlink()
                 except OSError:
                     pass
             self._profile_cache.clear()
-            return self.hands_players(user_scope)
-
-        if max_total_hands is not None and int(status.get("total_hands", 0)) > int(max_total_hands):
-            status = _rollback_uploads()
-            raise ValueError(
-                f"Upload exceeds plan limit of {int(max_total_hands)} total hands. "
-                f"Current uploaded hands: {int(status.get('total_hands', 0))}."
-            )
-        if max_hands_per_bucket is not None:
-            bucket_limit = int(max_hands_per_bucket)
-            violating = []
-            for row in status.get("players", []) or []:
-                hands_seen = int(row.get("hands_seen", 0))
-                if hands_seen > bucket_limit:
-                    violating.append(
-                        {
-                            "name": str(row.get("display_name") or row.get("username") or row.get("selection_key") or "unknown"),
-                            "hands_seen": hands_seen,
-                        }
-                    )
-            if violating:
-                violating.sort(key=lambda item: item["hands_seen"], reverse=True)
-                status = _rollback_uploads()
-                top = ", ".join(f"{entry['name']} ({entry['hands_seen']})" for entry in violating[:3])
-                raise ValueError(
-                    f"Upload exceeds plan limit of {bucket_limit} hands per player bucket. "
-                    f"Top bucket(s): {top}."
-                )
+            self._player_profiles_cache.clear()
+            self._player_index_cache.clear()
+            raise ValueError(violation)
         self._profile_cache.clear()
+        self._player_profiles_cache.clear()
+        self._player_index_cache.clear()
         return {
             "saved_files": saved,
             **status,
@@ -397,6 +675,8 @@ class TrainerService:
             raise ValueError(f"Could not delete uploaded file: {safe_name}") from exc
 
         self._profile_cache.clear()
+        self._player_profiles_cache.clear()
+        self._player_index_cache.clear()
         return {
             "deleted_file": safe_name,
             **self.hands_players(user_scope),
@@ -407,7 +687,12 @@ class TrainerService:
         return [str(row.get("selection_key") or row.get("username")) for row in uploaded]
 
     def _hands_snapshot_signature(self, user_scope: str | None = None) -> str:
-        """Stable signature of analyzer hand files used for cache invalidation."""
+        """
+        Stable signature of analyzer hand files used for cache invalidation.
+
+        Returned as a fixed-size digest: it is held in every cache key, and the
+        raw name:size:mtime list grows with the number of uploaded files.
+        """
         files = self._uploaded_hand_files(user_scope)
         if not files:
             return "missing"
@@ -418,7 +703,7 @@ class TrainerService:
             except OSError:
                 continue
             parts.append(f"{hand_file.name}:{st.st_size}:{st.st_mtime_ns}")
-        return "|".join(parts)
+        return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
 
     @staticmethod
     def _profile_dict_from_generated(
@@ -429,8 +714,12 @@ class TrainerService:
         source: str,
         include_exploits: bool = True,
     ) -> dict:
-        af = profile.postflop.total_aggression_factor
-        if af == float("inf") or math.isinf(af):
+        # Resolve each stat group once; the dict below reads from locals.
+        preflop = profile.preflop
+        postflop = profile.postflop
+        showdown = profile.showdown
+        af = postflop.total_aggression_factor
+        if math.isinf(af):
             af = 6.0
         return {
             "key": key,
@@ -438,21 +727,21 @@ class TrainerService:
             "source": source,
             "style_label": profile.play_style.value,
             "hands_analyzed": profile.hands_analyzed,
-            "vpip": round(profile.preflop.vpip, 4),
-            "pfr": round(profile.preflop.pfr, 4),
-            "three_bet": round(profile.preflop.three_bet_frequency, 4),
-            "fold_to_3bet": round(profile.preflop.fold_to_3bet, 4),
-            "limp_rate": round(profile.preflop.limp_rate, 4),
+            "vpip": round(preflop.vpip, 4),
+            "pfr": round(preflop.pfr, 4),
+            "three_bet": round(preflop.three_bet_frequency, 4),
+            "fold_to_3bet": round(preflop.fold_to_3bet, 4),
+            "limp_rate": round(preflop.limp_rate, 4),
             "af": round(float(af), 3),
-            "aggression_frequency": round(profile.postflop.total_aggression_frequency, 4),
-            "flop_cbet": round(profile.postflop.flop.cbet_frequency, 4),
-            "turn_cbet": round(profile.postflop.turn.cbet_frequency, 4),
-            "river_cbet": round(profile.postflop.river.cbet_frequency, 4),
-            "double_barrel": round(profile.postflop.double_barrel_frequency, 4),
-            "triple_barrel": round(profile.postflop.triple_barrel_frequency, 4),
-            "check_raise": round(profile.postflop.check_raise_frequency, 4),
-            "wtsd": round(profile.showdown.wtsd, 4),
-            "w_sd": round(profile.showdown.w_sd, 4),
+            "aggression_frequency": round(postflop.total_aggression_frequency, 4),
+            "flop_cbet": round(postflop.flop.cbet_frequency, 4),
+            "turn_cbet": round(postflop.turn.cbet_frequency, 4),
+            "river_cbet": round(postflop.river.cbet_frequency, 4),
+            "double_barrel": round(postflop.double_barrel_frequency, 4),
+            "triple_barrel": round(postflop.triple_barrel_frequency, 4),
+            "check_raise": round(postflop.check_raise_frequency, 4),
+            "wtsd": round(showdown.wtsd, 4),
+            "w_sd": round(showdown.w_sd, 4),
             "tendencies": list(profile.tendencies[:8]),
             "exploits": (
                 [
@@ -469,15 +758,36 @@ class TrainerService:
         }
 
     @staticmethod
-    def _weighted_average(profiles: Iterable[dict], field: str) -> float:
+    def _lru_get(cache: OrderedDict, key: Any) -> Any:
+        value = cache.get(key)
+        if value is not None:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass  # evicted by a concurrent request
+        return value
+
+    @staticmethod
+    def _lru_put(cache: OrderedDict, key: Any, value: Any, max_size: int) -> None:
+        cache[key] = value
+        while len(cache) > max_size:
+            try:
+                cache.popitem(last=False)
+            except KeyError:
+                break
+
+    @staticmethod
+    def _weighted_averages(profiles: Iterable[dict], fields: Iterable[str]) -> Dict[str, float]:
+        """Hands-weighted mean of each field, computing the weights once for all fields."""
         rows = list(profiles)
-        if not rows:
-            return 0.0
-        total_w = sum(max(1, int(p.get("hands_analyzed", 0))) for p in rows)
-        if total_w <= 0:
-            return 0.0
-        weighted = sum(float(p.get(field, 0.0)) * max(1, int(p.get("hands_analyzed", 0))) for p in rows)
-        return weighted / total_w
+        weights = [max(1, int(p.get("hands_analyzed", 0))) for p in rows]
+        total_w = sum(weights)
+        if not rows or total_w <= 0:
+            return {field: 0.0 for field in fields}
+        return {
+            field: sum(float(p.get(field, 0.0)) * w for p, w in zip(rows, weights)) / total_w
+            for field in fields
+        }
 
     def _resolve_player_ids(
         self,
@@ -490,9 +800,9 @@ class TrainerService:
         ids: Set[str] = set()
         display: List[str] = []
         seen_bucket_ids: Set[str] = set()
+        # Names come from _parse_names_input, which already stripped them.
         for raw_name in names:
-            token = raw_name.strip()
-            token_key = token.lower()
+            token_key = raw_name.lower()
             matched_bucket_ids: Set[str] = set()
 
             if token_key.startswith("id:"):
@@ -511,11 +821,11 @@ class TrainerService:
                 if bucket_id in seen_bucket_ids:
                     continue
                 entry = by_player_id.get(bucket_id)
-                if not entry:
+                if entry is None:
                     continue
                 seen_bucket_ids.add(bucket_id)
-                ids.add(str(entry["player_id"]))
-                names_joined = " / ".join(sorted(entry["usernames"], key=str.lower))
+                ids.add(str(entry.player_id))
+                names_joined = " / ".join(sorted(entry.usernames, key=str.lower))
                 display.append(names_joined)
         return ids, display, "uploaded_analyzer"
 
@@ -539,43 +849,49 @@ class TrainerService:
         scope_slug = self._user_scope_slug(user_scope)
         cache_key = f"{scope_slug}::{'x' if include_exploits else 'no-x'}::{key}"
         hands_snapshot = self._hands_snapshot_signature(user_scope)
-        cached = self._profile_cache.get(cache_key)
-        if cached and cached.get("snapshot") == hands_snapshot:
-            profile = cached.get("profile")
-            if isinstance(profile, dict):
-                return profile
+        # The snapshot is part of the key, so entries for replaced hand files are
+        # never hit again and simply age out of the LRU.
+        profile_key = (hands_snapshot, cache_key)
+        cached = self._lru_get(self._profile_cache, profile_key)
+        if cached is not None:
+            return cached
 
         active_files = self._uploaded_hand_files(user_scope)
         if not active_files:
             raise ValueError("No hand files available. Upload JSON hand histories first.")
         player_ids, display_names, source = self._resolve_player_ids(names, user_scope)
 
-        from parser import load_hands  # local import to avoid startup cost
-        from stats.aggregate import generate_profile
-
-        all_hands = []
-        for hand_file in active_files:
-            all_hands.extend(load_hands(hand_file))
-        if not all_hands:
-            raise ValueError("No hands loaded from available hand files")
-
-        per_player_profiles: List[dict] = []
-        for player_id in sorted(player_ids):
-            generated = generate_profile(all_hands, player_id)
-            if generated.hands_analyzed <= 0:
-                continue
-            per_player_profiles.append(
-                self._profile_dict_from_generated(
-                    generated,
-                    key=player_id,
-                    name=player_id,
-                    source=source,
-                    include_exploits=include_exploits,
+        # Different name lists (aliases, id: keys, ordering) can resolve to the
+        # same buckets; the per-player profiles only depend on which ones.
+        ids_key = (hands_snapshot, scope_slug, include_exploits, tuple(sorted(player_ids)))
+        per_player_profiles = self._lru_get(self._player_profiles_cache, ids_key)
+        if per_player_profiles is None:
+            from parser import load_hands  # local import to avoid startup cost
+            from stats.aggregate import generate_profiles
+
+            all_hands = []
+            for hand_file in active_files:
+                all_hands.extend(load_hands(hand_file))
+            if not all_hands:
+                raise ValueError("No hands loaded from available hand files")
+
+            per_player_profiles = []
+            for player_id, generated in generate_profiles(all_hands, sorted(player_ids)).items():
+                if generated.hands_analyzed <= 0:
+                    continue
+                per_player_profiles.append(
+                    self._profile_dict_from_generated(
+                        generated,
+                        key=player_id,
+                        name=player_id,
+                        source=source,
+                        include_exploits=include_exploits,
+                    )
                 )
-            )
-        if not per_player_profiles:
-            requested = ", ".join(display_names)
-            raise ValueError(f"No analyzable hands found for: {requested}")
+            if not per_player_profiles:
+                requested = ", ".join(display_names)
+                raise ValueError(f"No analyzable hands found for: {requested}")
+            self._lru_put(self._player_profiles_cache, ids_key, per_player_profiles, self._profile_cache_max)
 
         if len(per_player_profiles) == 1:
             single = dict(per_player_profiles[0])
@@ -618,27 +934,19 @@ class TrainerService:
                     for (category, description, counter), _ in exploit_counter.most_common(10)
                     if description
                 ]
+            averages = self._weighted_averages(
+                per_player_profiles, (field for field, _digits in self.AGGREGATED_STAT_FIELDS)
+            )
             built = {
                 "key": key,
                 "name": " + ".join(name.upper() for name in display_names),
                 "source": source,
                 "style_label": style_counter.most_common(1)[0][0] if style_counter else "Unknown",
                 "hands_analyzed": int(total_hands),
-                "vpip": round(self._weighted_average(per_player_profiles, "vpip"), 4),
-                "pfr": round(self._weighted_average(per_player_profiles, "pfr"), 4),
-                "three_bet": round(self._weighted_average(per_player_profiles, "three_bet"), 4),
-                "fold_to_3bet": round(self._weighted_average(per_player_profiles, "fold_to_3bet"), 4),
-                "limp_rate": round(self._weighted_average(per_player_profiles, "limp_rate"), 4),
-                "af": round(self._weighted_average(per_player_profiles, "af"), 3),
-                "aggression_frequency": round(self._weighted_average(per_player_profiles, "aggression_frequency"), 4),
-                "flop_cbet": round(self._weighted_average(per_player_profiles, "flop_cbet"), 4),
-                "turn_cbet": round(self._weighted_average(per_player_profiles, "turn_cbet"), 4),
-                "river_cbet": round(self._weighted_average(per_player_profiles, "river_cbet"), 4),
-                "double_barrel": round(self._weighted_average(per_player_profiles, "double_barrel"), 4),
-                "triple_barrel": round(self._weighted_average(per_player_profiles, "triple_barrel"), 4),
-                "check_raise": round(self._weighted_average(per_player_profiles, "check_raise"), 4),
-                "wtsd": round(self._weighted_average(per_player_profiles, "wtsd"), 4),
-                "w_sd": round(self._weighted_average(per_player_profiles, "w_sd"), 4),
+                **{
+                    field: round(averages[field], digits)
+                    for field, digits in self.AGGREGATED_STAT_FIELDS
+                },
                 "tendencies": [text for text, _ in tendency_counter.most_common(8)],
                 "exploits": exploits,
                 "selected_usernames": display_names,
@@ -649,10 +957,7 @@ class TrainerService:
         built.setdefault("selected_usernames", display_names)
         built.setdefault("player_ids", sorted(player_ids))
         built.setdefault("players_aggregated", len(per_player_profiles))
-        self._profile_cache[cache_key] = {
-            "snapshot": hands_snapshot,
-            "profile": built,
-        }
+        self._lru_put(self._profile_cache, profile_key, built, self._profile_cache_max)
         return built
 
     def app_config(self, user_scope: str | None = None) -> Dict[str, Any]:
@@ -691,6 +996,22 @@ class TrainerService:
             },
         }
 
+    def app_config_json(self, user_scope: str | None = None) -> bytes:
+        """
+        app_config encoded as JSON bytes.
+
+        Everything but the live hand status is static, so the encoded body is
+        reused until the scope's hand files change.
+        """
+        scope_key = str(user_scope or "")
+        signature = self._hands_snapshot_signature(user_scope)
+        cached = self._lru_get(self._app_config_cache, scope_key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        data = _dumps_json_bytes(self.app_config(user_scope))
+        self._lru_put(self._app_config_cache, scope_key, (signature, data), self._app_config_cache_max)
+        return data
+
     def generate(self, payload: dict) -> dict:
         scenario = generate_scenario(payload)
         self.store.save_scenario(scenario)
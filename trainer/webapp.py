@@ -10,6 +10,7 @@ from typing import Set
 from urllib.parse import quote
 
 from flask import Flask, g, jsonify, make_response, redirect, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 
 from trainer.billing import (
     PLAN_ELITE,
@@ -20,6 +21,11 @@ from trainer.billing import (
 )
 from trainer.service import TrainerService
 
+try:  # pragma: no cover - optional speedup for API payloads
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - Flask's stdlib json provider is used instead
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 WEB_ROOT = Path(__file__).resolve().parent / "web"
 
@@ -109,6 +115,31 @@ class RuntimeConfig:
     secret_key: str
 
 
+class _OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; Flask's ``default`` still handles extra types."""
+
+    def _options(self, pretty: bool = False) -> int:
+        # Datetimes pass through to ``default`` so they keep Flask's HTTP-date format.
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode("utf-8")
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        pretty = self.compact is False or (self.compact is None and self._app.debug)
+        data = orjson.dumps(obj, default=self.default, option=self._options(pretty))
+        return self._app.response_class(data, mimetype=self.mimetype)
+
+
 def _load_runtime_config() -> RuntimeConfig:
     env = str(os.getenv("TRAINER_ENV", "development")).strip().lower()
     secret_key = str(os.getenv("TRAINER_SECRET_KEY", "")).strip()
@@ -167,6 +198,8 @@ def create_app() -> Flask:
 
     app = Flask(__name__)
     app.config["JSON_SORT_KEYS"] = False
+    if orjson is not None:
+        app.json = _OrjsonProvider(app)
 
     def _base_url() -> str:
         if runtime.public_base_url:
@@ -405,7 +438,10 @@ def create_app() -> Flask:
 
     @app.get("/api/config")
     def api_config():
-        return jsonify(service.app_config(user_scope=_current_user_scope()))
+        return app.response_class(
+            service.app_config_json(user_scope=_current_user_scope()),
+            mimetype="application/json",
+        )
 
     @app.get("/api/scenario")
     def api_scenario():
@@ -6,7 +6,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from trainer.server import run_server
+from trainer.server import DEFAULT_HTTP_THREADS, run_server
 from trainer.service import TrainerService
 
 
@@ -21,6 +21,17 @@ def parse_args() -> argparse.Namespace:
         default="trainer/data/trainer.db",
         help="SQLite database path (default: trainer/data/trainer.db)",
     )
+    parser.add_argument(
+        "--http-threads",
+        type=int,
+        default=DEFAULT_HTTP_THREADS,
+        help=f"Worker threads serving HTTP connections (default: {DEFAULT_HTTP_THREADS})",
+    )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        help="Log every HTTP request to stderr",
+    )
     parser.add_argument(
         "--no-browser",
         action="store_true",
@@ -37,6 +48,8 @@ def main() -> None:
         host=args.host,
         port=args.port,
         open_browser=not args.no_browser,
+        http_threads=args.http_threads,
+        access_log=args.access_log,
     )
 
 